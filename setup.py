@@ -17,5 +17,11 @@ setup(
             "image-import-check=python.image_import_check:main",
         ],
     },
+    extras_require={
+        # Optional C-accelerated JSON handling for package.json, a linear-time
+        # regex engine for format-imports' alias matcher and multi-pattern
+        # substring search for image-import-check's --ignore rules
+        "speedups": ["orjson", "google-re2", "pyahocorasick"],
+    },
     python_requires=">=3.6",
 )
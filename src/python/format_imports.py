@@ -1,13 +1,125 @@
 import argparse
-import glob
 import json
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .utils import read_json_file
+
+try:
+    # Optional linear-time regex engine for the alias matcher
+    import re2
+except ImportError:
+    re2 = None
 
 # Regex to find import/export statements.
 # Handles: import ... from '...'; export ... from '...'; import '...';
+# This needs a backreference, which re2 doesn't support, so it stays on `re`.
 IMPORT_REGEX = re.compile(r"""(?:import|export)(?:.*from\s*)?(["'])(.+?)\1""")
 
+# Bytes pre-check for an import of a relative path, the only kind that can be
+# aliased. It matches wherever IMPORT_REGEX finds a path starting with ".".
+RELATIVE_IMPORT_BYTES_REGEX = re.compile(rb"""(?:import|export)(?:.*from\s*)?["']\.""")
+
+# File extensions to process
+SOURCE_EXTENSIONS = (".js", ".ts", ".jsx", ".tsx", ".vue")
+
+# Directories that never contain sources worth rewriting
+IGNORED_DIR_NAMES = frozenset({"node_modules", ".git", ".next", "dist", "build"})
+
+# Number of per-file messages buffered before they are written out
+REPORT_BATCH_SIZE = 100
+
+# Sidecar cache of files already processed, relative to the project root
+FILE_CACHE_PATH = os.path.join("node_modules", ".cache", "format-imports", "files.json")
+
+
+def load_file_cache(root_dir, config_key):
+    """
+    Loads the (mtime, size) signatures of files processed by a previous run.
+
+    Args:
+        root_dir: The project root the cache lives under.
+        config_key: Description of the alias configuration the cache was built with.
+
+    Returns:
+        A dictionary mapping file paths (relative to `root_dir`) to
+        `[mtime_ns, size]`, or an empty dictionary if there is no usable cache
+        for this configuration.
+    """
+    try:
+        cache = read_json_file(os.path.join(root_dir, FILE_CACHE_PATH))
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(cache, dict) or cache.get("config") != config_key:
+        # Aliases changed, so files that were up to date may need rewriting now
+        return {}
+    return cache.get("files", {})
+
+
+def _write_cache(cache_path, data):
+    """
+    Atomically writes a JSON cache file. Errors are ignored.
+
+    Args:
+        cache_path: Absolute path of the cache file.
+        data: JSON-serialisable data to store.
+    """
+    tmp_path = cache_path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def save_file_cache(root_dir, config_key, files):
+    """
+    Persists file signatures for the next run. Errors are ignored.
+
+    Args:
+        root_dir: The project root the cache lives under.
+        config_key: Description of the alias configuration in effect.
+        files: Mapping of relative file paths to `[mtime_ns, size]`.
+    """
+    _write_cache(
+        os.path.join(root_dir, FILE_CACHE_PATH), {"config": config_key, "files": files}
+    )
+
+
+def _iter_source_files(root):
+    """
+    Yields the source files under a directory in a single walk.
+
+    Ignored directories are pruned without being entered. Like the glob
+    patterns this replaces, hidden files and directories are skipped.
+
+    Args:
+        root: Absolute directory to walk.
+
+    Yields:
+        Absolute paths of files with one of `SOURCE_EXTENSIONS`.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in IGNORED_DIR_NAMES:
+                    stack.append(entry.path)
+            elif entry.name.endswith(SOURCE_EXTENSIONS):
+                yield entry.path
+
 
 def get_tsconfig_paths_and_baseurl(directory):
     """
@@ -38,9 +150,8 @@ def get_tsconfig_paths_and_baseurl(directory):
         print(f"Using {tsconfig_filename} from {directory}")
 
     try:
-        with open(tsconfig_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
-    except json.JSONDecodeError:
+        config = read_json_file(tsconfig_path)
+    except ValueError:
         print(f"Error decoding JSON from {tsconfig_path}")
         return None, None
     except Exception as e:
@@ -81,8 +192,114 @@ def get_tsconfig_paths_and_baseurl(directory):
     return resolved_aliases, abs_base_url
 
 
+def compile_alias_matcher(path_aliases_map):
+    """
+    Compiles the alias targets into a single function mapping absolute paths
+    to aliased import paths.
+
+    Targets are tried longest first, so the first alternative that matches is
+    the longest target directory containing the import. When several aliases
+    share a target, the shortest alias prefix (the shortest rewritten path) is
+    kept. The common single-target configuration (e.g. `"@/*": ["src/*"]`)
+    gets a plain prefix check instead of a regex.
+
+    Args:
+        path_aliases_map: Mapping produced by `get_tsconfig_paths_and_baseurl`.
+
+    Returns:
+        A function taking a normalized absolute path and returning the aliased
+        import path, or None if the path isn't under any alias target.
+    """
+    targets_to_alias = {}
+    for alias_prefix_str, abs_target_dirs_for_alias in path_aliases_map.items():
+        for abs_target_dir in abs_target_dirs_for_alias:
+            # Adds os.sep if not present at end, so '/abs/src' doesn't match '/abs/srcfoo'
+            target_dir_path_for_match = os.path.join(abs_target_dir, "")
+            current_alias = targets_to_alias.get(target_dir_path_for_match)
+            if current_alias is None or len(alias_prefix_str) < len(current_alias):
+                targets_to_alias[target_dir_path_for_match] = alias_prefix_str
+
+    sep = os.sep
+
+    if not targets_to_alias:
+        return lambda abs_path: None
+
+    if len(targets_to_alias) == 1:
+        ((target, alias_prefix),) = targets_to_alias.items()
+        target_len = len(target)
+
+        def match_single_alias(abs_path):
+            if not abs_path.startswith(target):
+                return None
+            # Standardize the part below the target directory to forward slashes
+            return alias_prefix + abs_path[target_len:].replace(sep, "/")
+
+        return match_single_alias
+
+    targets = sorted(targets_to_alias, key=len, reverse=True)
+    pattern = "(" + "|".join(re.escape(target) for target in targets) + ")"
+    matcher = re2.compile(pattern) if re2 is not None else re.compile(pattern)
+    match_target = matcher.match
+
+    def match_alias(abs_path):
+        match = match_target(abs_path)
+        if match is None:
+            return None
+        # Standardize the part below the target directory to forward slashes
+        relative_suffix = abs_path[match.end() :].replace(sep, "/")
+        return targets_to_alias[match.group(1)] + relative_suffix
+
+    return match_alias
+
+
+def split_dir_parts(abs_dir):
+    """
+    Splits a normalized absolute directory into its components.
+
+    Args:
+        abs_dir: Normalized absolute directory, e.g. '/abs/project/src'.
+
+    Returns:
+        A tuple whose first item is the root ('' on POSIX, the drive on
+        Windows) followed by the directory names, e.g. `('', 'abs', 'project', 'src')`.
+    """
+    parts = abs_dir.split(os.sep)
+    return (parts[0],) + tuple(part for part in parts[1:] if part)
+
+
+def resolve_relative_path(dir_parts, relative_path):
+    """
+    Resolves a '/'-separated relative import path against a directory.
+
+    Equivalent to `os.path.normpath(os.path.join(dir, relative_path))` for the
+    relative specifiers found in imports, without the generic path handling.
+
+    Args:
+        dir_parts: Directory components from `split_dir_parts`.
+        relative_path: Import path such as '../utils/helpers'.
+
+    Returns:
+        The normalized absolute path.
+    """
+    parts = list(dir_parts)
+    for part in relative_path.split("/"):
+        if part == "..":
+            # Like normpath, '..' at the root stays at the root
+            if len(parts) > 1:
+                parts.pop()
+        elif part and part != ".":
+            parts.append(part)
+    resolved = os.sep.join(parts)
+    return resolved if len(parts) > 1 else resolved + os.sep
+
+
 def format_single_import_path(
-    original_module_path, current_file_abs_dir, path_aliases_map, abs_base_url
+    original_module_path,
+    current_file_abs_dir,
+    path_aliases_map,
+    abs_base_url,
+    alias_matcher=None,
+    current_file_dir_parts=None,
 ):
     """
     Attempts to convert an original_module_path to an aliased path.
@@ -94,6 +311,10 @@ def format_single_import_path(
         path_aliases_map: Mapping produced by `get_tsconfig_paths_and_baseurl`,
             e.g. `{"@/": ["/abs/project/src/"]}`.
         abs_base_url: Absolute baseUrl from tsconfig.
+        alias_matcher: Result of `compile_alias_matcher(path_aliases_map)`;
+            compiled on the fly if not given.
+        current_file_dir_parts: `split_dir_parts(current_file_abs_dir)`, to
+            avoid splitting it again for every import of the same file.
 
     Returns:
         The possibly rewritten import path using the configured alias prefix,
@@ -112,46 +333,21 @@ def format_single_import_path(
     ):  # Should generally not happen for typical project imports
         abs_imported_item_path = os.path.normpath(original_module_path)
     else:
-        abs_imported_item_path = os.path.normpath(
-            os.path.join(current_file_abs_dir, original_module_path)
+        if current_file_dir_parts is None:
+            current_file_dir_parts = split_dir_parts(current_file_abs_dir)
+        abs_imported_item_path = resolve_relative_path(
+            current_file_dir_parts, original_module_path
         )
 
-    best_aliased_path = original_module_path
-    longest_target_prefix_match_len = -1
+    if alias_matcher is None:
+        alias_matcher = compile_alias_matcher(path_aliases_map)
+    aliased_path = alias_matcher(abs_imported_item_path)
+    return original_module_path if aliased_path is None else aliased_path
 
-    for alias_prefix_str, abs_target_dirs_for_alias in path_aliases_map.items():
-        for abs_target_dir in abs_target_dirs_for_alias:
-            # Ensure abs_target_dir ends with a separator for correct prefix matching
-            # e.g., /abs/project/src becomes /abs/project/src/
-            # This makes '/abs/project/src/foo'.startswith('/abs/project/src/') work correctly.
-            target_dir_path_for_match = os.path.join(
-                abs_target_dir, ""
-            )  # Adds os.sep if not present at end
-
-            if abs_imported_item_path.startswith(target_dir_path_for_match):
-                # Calculate the part of the path relative to the target directory
-                relative_suffix = abs_imported_item_path[
-                    len(target_dir_path_for_match) :
-                ]
-                relative_suffix = relative_suffix.replace(
-                    os.sep, "/"
-                )  # Standardize to forward slashes
-
-                potential_new_path = alias_prefix_str + relative_suffix
-
-                current_match_len = len(target_dir_path_for_match)
-                if current_match_len > longest_target_prefix_match_len:
-                    longest_target_prefix_match_len = current_match_len
-                    best_aliased_path = potential_new_path
-                elif current_match_len == longest_target_prefix_match_len:
-                    # If target prefix match length is the same, prefer the shorter resulting aliased path
-                    if len(potential_new_path) < len(best_aliased_path):
-                        best_aliased_path = potential_new_path
-
-    return best_aliased_path
-
-
-def process_file_content(content, file_abs_dir, path_aliases_map, abs_base_url):
+
+def process_file_content(
+    content, file_abs_dir, path_aliases_map, abs_base_url, alias_matcher=None
+):
     """
     Applies import formatting to the string content of a file.
 
@@ -160,36 +356,117 @@ def process_file_content(content, file_abs_dir, path_aliases_map, abs_base_url):
         file_abs_dir: Absolute directory of the file being processed.
         path_aliases_map: Alias mapping from `get_tsconfig_paths_and_baseurl`.
         abs_base_url: Absolute baseUrl from tsconfig.
+        alias_matcher: Result of `compile_alias_matcher(path_aliases_map)`;
+            compiled on the fly if not given.
 
     Returns:
         The modified file content with imports rewritten where applicable.
     """
-    modified_content = content
-
-    def replace_import_path_match(match_obj):
-        quote_char = match_obj.group(1)
+    if alias_matcher is None:
+        alias_matcher = compile_alias_matcher(path_aliases_map)
+    file_dir_parts = split_dir_parts(file_abs_dir)
+
+    # Copy the text between rewritten paths as slices and join once at the end.
+    # The regex is (?:import|export)(?:.*from\s*)?(["'])(.+?)\1, so group 2 is
+    # exactly the module path between the quotes.
+    parts = []
+    last_end = 0
+    for match_obj in IMPORT_REGEX.finditer(content):
         original_path = match_obj.group(2)
 
         if not original_path or original_path.isspace():
-            return match_obj.group(0)
+            continue
 
         new_path = format_single_import_path(
-            original_path, file_abs_dir, path_aliases_map, abs_base_url
+            original_path,
+            file_abs_dir,
+            path_aliases_map,
+            abs_base_url,
+            alias_matcher=alias_matcher,
+            current_file_dir_parts=file_dir_parts,
         )
 
         if new_path != original_path:
-            # Ensure the full matched string is reconstructed correctly
-            # The regex is (?:import|export)(?:.*from\s*)?(["'])(.+?)\1
-            # match_obj.group(0) is the whole import statement part like `from "./foo"` or just `"./foo"`
-            # We need to replace original_path within quote_char + original_path + quote_char
-            return match_obj.group(0).replace(
-                quote_char + original_path + quote_char,
-                quote_char + new_path + quote_char,
-            )
-        return match_obj.group(0)
+            parts.append(content[last_end : match_obj.start(2)])
+            parts.append(new_path)
+            last_end = match_obj.end(2)
+
+    if not parts:
+        return content
+    parts.append(content[last_end:])
+    return "".join(parts)
+
+
+# Per-process state set up by _init_worker
+_worker_state = {}
+
+
+def _init_worker(path_aliases_map, abs_base_url):
+    """
+    Sets up a worker process with the alias configuration and compiled matcher.
 
-    modified_content = IMPORT_REGEX.sub(replace_import_path_match, modified_content)
-    return modified_content
+    Args:
+        path_aliases_map: Alias mapping from `get_tsconfig_paths_and_baseurl`.
+        abs_base_url: Absolute baseUrl from tsconfig.
+    """
+    _worker_state["path_aliases_map"] = path_aliases_map
+    _worker_state["abs_base_url"] = abs_base_url
+    _worker_state["alias_matcher"] = compile_alias_matcher(path_aliases_map)
+
+
+def _process_one(file_path):
+    """
+    Rewrites the imports of a single file in place.
+
+    Args:
+        file_path: Absolute path of the file to process.
+
+    Returns:
+        A tuple `(signature, formatted, error)` where `signature` is the file's
+        `[mtime_ns, size]` after processing (None if it couldn't be read),
+        `formatted` says whether the file was rewritten, and `error` is a
+        message if writing the file failed.
+    """
+    try:
+        stat = os.stat(file_path)
+        with open(file_path, "rb") as f:
+            raw = f.read()
+    except Exception:
+        return None, False, None
+
+    # A substring scan is far cheaper than the regex and rules out most
+    # asset/data modules, which have nothing to rewrite
+    if b"import" not in raw and b"export" not in raw:
+        return [stat.st_mtime_ns, stat.st_size], False, None
+    # Files without relative imports can't change, so don't decode them
+    if not RELATIVE_IMPORT_BYTES_REGEX.search(raw):
+        return [stat.st_mtime_ns, stat.st_size], False, None
+
+    try:
+        original_content = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return None, False, None
+
+    # file_path is already absolute from _iter_source_files
+    modified_content = process_file_content(
+        original_content,
+        os.path.dirname(file_path),
+        _worker_state["path_aliases_map"],
+        _worker_state["abs_base_url"],
+        alias_matcher=_worker_state["alias_matcher"],
+    )
+
+    if modified_content == original_content:
+        return [stat.st_mtime_ns, stat.st_size], False, None
+
+    try:
+        # The content was decoded from raw bytes, so write line endings as-is
+        with open(file_path, "w", encoding="utf-8", newline="") as f:
+            f.write(modified_content)
+        stat = os.stat(file_path)
+    except Exception as e:
+        return None, False, str(e)
+    return [stat.st_mtime_ns, stat.st_size], True, None
 
 
 def main():
@@ -211,6 +488,11 @@ def main():
         default=os.getcwd(),
         help="The root directory to scan for tsconfig/jsconfig and source files (defaults to current directory).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the cache of unchanged files and process every file.",
+    )
     args = parser.parse_args()
 
     root_dir = os.path.abspath(args.directory)
@@ -227,46 +509,52 @@ def main():
     print(f"Effective baseUrl: {abs_base_url}")
     print(f"Loaded path aliases: {json.dumps(path_aliases, indent=2)}")
 
-    # Define file extensions to process
-    file_patterns = ["**/*.js", "**/*.ts", "**/*.jsx", "**/*.tsx", "**/*.vue"]
-    files_to_scan = []
-    for pattern in file_patterns:
-        # glob from root_dir
-        glob_pattern = os.path.join(root_dir, pattern)
-        files_to_scan.extend(glob.glob(glob_pattern, recursive=True))
+    files_to_scan = _iter_source_files(root_dir)
 
-    # Filter out files from common ignored directories
-    ignored_dirs_parts = {os.sep + "node_modules" + os.sep, os.sep + ".git" + os.sep}
+    # Files whose mtime and size are unchanged since the last run with the same
+    # aliases are already formatted and can be skipped
+    config_key = {"baseUrl": abs_base_url, "paths": path_aliases}
+    file_cache = {} if args.no_cache else load_file_cache(root_dir, config_key)
+    new_file_cache = {}
 
-    processed_files_count = 0
+    files_to_process = []
     for file_path in files_to_scan:
-        # Check if any part of the path indicates an ignored directory
-        if any(ignored_part in file_path for ignored_part in ignored_dirs_parts):
-            continue
-
+        rel_path = os.path.relpath(file_path, root_dir)
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                original_content = f.read()
-        except Exception as e:
+            stat = os.stat(file_path)
+        except OSError:
             continue
+        signature = [stat.st_mtime_ns, stat.st_size]
+        if file_cache.get(rel_path) == signature:
+            new_file_cache[rel_path] = signature
+            continue
+        files_to_process.append(file_path)
 
-        file_abs_dir = os.path.dirname(
-            file_path
-        )  # file_path is already absolute from glob
-        modified_content = process_file_content(
-            original_content, file_abs_dir, path_aliases, abs_base_url
-        )
-
-        if modified_content != original_content:
-            try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(modified_content)
-                print(f"  Formatted imports in {os.path.basename(file_path)}")
+    # Rewriting is pure-Python regex work, so spread the files over processes
+    # Per-file messages are written in batches rather than one print per file
+    processed_files_count = 0
+    report_lines = []
+    with ProcessPoolExecutor(
+        initializer=_init_worker, initargs=(path_aliases, abs_base_url)
+    ) as executor:
+        results = executor.map(_process_one, files_to_process, chunksize=32)
+        for file_path, (signature, formatted, error) in zip(files_to_process, results):
+            if error:
+                report_lines.append(f"  Error writing updated file: {error}\n")
+            elif formatted:
+                report_lines.append(
+                    f"  Formatted imports in {os.path.basename(file_path)}\n"
+                )
                 processed_files_count += 1
-            except Exception as e:
-                print(f"  Error writing updated file: {e}")
-        # else:
-        # print(f"  No changes for {os.path.basename(file_path)}")
+            if signature is not None:
+                new_file_cache[os.path.relpath(file_path, root_dir)] = signature
+            if len(report_lines) >= REPORT_BATCH_SIZE:
+                sys.stdout.write("".join(report_lines))
+                report_lines = []
+    sys.stdout.write("".join(report_lines))
+
+    if not args.no_cache:
+        save_file_cache(root_dir, config_key, new_file_cache)
 
     print(f"Import formatting complete. {processed_files_count} file(s) modified.")
 
@@ -16,25 +16,173 @@ import fnmatch
 
 import argparse
 import concurrent.futures
+import functools
+import mmap
 import os
 import re
+import sys
+import time
 from pathlib import Path
-from typing import List, Pattern, Tuple
+from typing import Callable, Dict, List, Pattern, Tuple
+
+try:
+    # Optional multi-pattern substring search for large --ignore lists
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 VISUAL_EXTENSIONS = r"(?:css|png|jpe?g|gif|svg|webp|avif|bmp|ico|tiff?)"
 
-IMPORT_RE = re.compile(rf"^\s*(?:import|export)\s+(?:.*from\s+)?([\'\"])(?P<path>.*?\.{VISUAL_EXTENSIONS})\1\s*;?\s*$")
-REQUIRE_RE = re.compile(rf"require\s*\(\s*([\'\"])(?P<path>.*?\.{VISUAL_EXTENSIONS})\1\s*\)")
-DYNAMIC_IMPORT_RE = re.compile(rf"import\s*\(\s*([\'\"])(?P<path>.*?\.{VISUAL_EXTENSIONS})\1\s*\)")
+
+def _import_sources(tag: str = "") -> List[str]:
+    """Return the import/require/dynamic-import regex sources.
+
+    Named groups get `tag` appended so that several sources can be joined
+    into one alternation without clashing group names.
+    """
+    quoted = (
+        rf"(?P<quote{tag}>[\'\"])(?P<path{tag}>.*?\.{VISUAL_EXTENSIONS})(?P=quote{tag})"
+    )
+    return [
+        rf"^\s*(?:import|export)\s+(?:.*from\s+)?{quoted}\s*;?\s*$",
+        rf"require\s*\(\s*{quoted}\s*\)",
+        rf"import\s*\(\s*{quoted}\s*\)",
+    ]
+
+
+IMPORT_RE, REQUIRE_RE, DYNAMIC_IMPORT_RE = (
+    re.compile(src) for src in _import_sources()
+)
 IMPORT_PATTERNS = [IMPORT_RE, REQUIRE_RE, DYNAMIC_IMPORT_RE]
 
+# All patterns in one alternation, applied to the whole file at once. The
+# matched alternative's `path<i>` group is always the last group it sets.
+# It works on bytes so files can be scanned straight from a memory map.
+COMBINED_IMPORT_RE = re.compile(
+    "|".join(
+        f"(?:{_import_sources(str(i))[i]})" for i in range(len(IMPORT_PATTERNS))
+    ).encode(),
+    re.MULTILINE,
+)
+
+# Files at least this large are memory-mapped rather than read into memory
+MMAP_THRESHOLD = 4096
+
+# Leading bytes sniffed to recognise binary and minified files
+SNIFF_SIZE = 4096
+
+# Files larger than this whose first SNIFF_SIZE bytes hold no line break are
+# treated as minified bundles and not scanned
+MINIFIED_MIN_SIZE = 100 * 1024
+
+# Minified bundles match the source patterns but are never worth scanning
+SKIPPED_FILE_PATTERNS = ["*.min.js"]
+
+# Number of files checked per thread-pool task
+CHECK_BATCH_SIZE = 64
+
+# Minimum number of seconds between progress bar redraws
+PROGRESS_INTERVAL = 0.05
+
+
+def _thread_pool_size(jobs: int | None = None) -> int:
+    """Return the number of reader threads.
+
+    An explicit `jobs` wins, then the THREAD_POOL_SIZE environment variable.
+    The default is generous because readers spend most of their time blocked
+    on the filesystem; too many threads only costs scheduler overhead, while
+    too few leaves the disk (or network share) idle.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+    default = min(256, cpus * 16)
+
+    if jobs is not None and jobs > 0:
+        return jobs
+    try:
+        size = int(os.environ.get("THREAD_POOL_SIZE", default))
+    except ValueError:
+        return default
+    return size if size > 0 else default
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_file_patterns(patterns: Tuple[str, ...]) -> Pattern:
+    """Translate filename globs into one regex, matching like `fnmatch.fnmatch`."""
+    # fnmatch folds case where the filesystem does (i.e. on Windows)
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns), flags)
+
+
+def _scan_asset_imports(src: Path) -> List[Tuple[int, str]]:
+    """Return `(lineno, import_path)` for every visual asset import in `src`.
+
+    Binary files (a NUL byte near the start) and minified bundles (no line
+    break near the start of a large file) are skipped without a full scan.
+
+    Raises:
+        OSError: If the file can't be read.
+    """
+    found: List[Tuple[int, str]] = []
+    with open(src, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            data = f.read()
+            mm = None
+        else:
+            data = mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            head = data[:SNIFF_SIZE]
+            if b"\x00" in head or (size > MINIFIED_MIN_SIZE and b"\n" not in head):
+                return found
+            # Line numbers are counted incrementally between matches
+            lineno = 1
+            counted_to = 0
+            for m in COMBINED_IMPORT_RE.finditer(data):
+                path_group = m.lastgroup
+                path_start = m.start(path_group)
+                lineno += data[counted_to:path_start].count(b"\n")
+                counted_to = path_start
+                found.append((lineno, m.group(path_group).decode("utf-8", "replace")))
+        finally:
+            if mm is not None:
+                mm.close()
+    return found
+
+
+def _compile_substring_matcher(substrings: List[str]) -> Callable[[str], bool]:
+    """Return a function telling whether a text contains any of `substrings`.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    a single regex alternation, so each test is one scan of the text.
+    """
+    needles = [sub for sub in substrings if sub]
+    if len(needles) < len(substrings):
+        # "" is contained in every path, as with the plain `in` test
+        return lambda text: True
+    if not needles:
+        return lambda text: False
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for sub in needles:
+            automaton.add_word(sub, sub)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+
+    search = re.compile("|".join(re.escape(sub) for sub in needles)).search
+    return lambda text: search(text) is not None
+
 
 def find_source_files(
     directory: Path,
     patterns: List[str],
     ignore_substrings: List[str] | None = None,
     ignore_regexes: List[Pattern] | None = None,
+    exclude_patterns: List[str] | None = None,
 ) -> List[Path]:
     """
     Walk `directory` and return files matching any `patterns`.
@@ -44,6 +192,7 @@ def find_source_files(
         patterns: Filename patterns to match (e.g., ['*.ts', '*.js']).
         ignore_substrings: Substrings of paths to skip.
         ignore_regexes: Compiled regexes to skip matching paths.
+        exclude_patterns: Filename patterns to skip even if they match `patterns`.
 
     Returns:
         A sorted list of `Path` objects matching the given patterns and not
@@ -55,34 +204,43 @@ def find_source_files(
         ignore_regexes = []
 
     # Normalize ignore directory names (strip trailing slashes)
-    ignore_dir_names = [s.rstrip("/\\") for s in ignore_substrings]
-
+    ignore_dir_names = frozenset(s.rstrip("/\\") for s in ignore_substrings)
+
+    file_match = _compile_file_patterns(tuple(patterns)).match
+    if exclude_patterns:
+        exclude_match = _compile_file_patterns(tuple(exclude_patterns)).match
+    else:
+        exclude_match = lambda name: None
+    is_ignored_path = _compile_substring_matcher(ignore_substrings)
     found: List[Path] = []
-    for root, dirs, files in os.walk(directory):
-        # Prune `dirs` in-place so os.walk won't recurse into them
-        pruned_dirs = []
-        for d in dirs:
-            dpath = Path(root) / d
-            dpath_text = dpath.as_posix()
-            # skip if the directory path contains any ignore substring
-            if any(sub in dpath_text for sub in ignore_substrings):
-                continue
-            # skip if any ignore-regex matches the directory path
-            if any(rx.search(dpath_text) for rx in (ignore_regexes or [])):
-                continue
-            # optionally skip by exact directory name (helps common-case node_modules)
-            if d in ignore_dir_names:
-                continue
-            pruned_dirs.append(d)
-        # replace dirs so walk won't descend into pruned dirs
-        dirs[:] = pruned_dirs
 
-        # Now check files in this (non-ignored) directory
-        for f in files:
-            for pat in patterns:
-                if fnmatch.fnmatch(f, pat):
-                    found.append(Path(root) / f)
-                    break
+    def _walk(path: str) -> None:
+        # DirEntry carries the file type from the directory listing, so
+        # pruning and matching need no extra stat per entry
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir():
+                # like os.walk, don't descend into symlinked directories
+                if entry.name in ignore_dir_names or entry.is_symlink():
+                    continue
+                dpath_text = (
+                    entry.path if os.sep == "/" else entry.path.replace(os.sep, "/")
+                )
+                # skip if the directory path contains any ignore substring
+                if is_ignored_path(dpath_text):
+                    continue
+                # skip if any ignore-regex matches the directory path
+                if any(rx.search(dpath_text) for rx in ignore_regexes):
+                    continue
+                _walk(entry.path)
+            elif file_match(entry.name) and not exclude_match(entry.name):
+                found.append(Path(entry.path))
+
+    _walk(str(directory))
 
     # Keep deterministic order
     return sorted(found)
@@ -93,6 +251,7 @@ def check_css_imports(
     ignore_substrings: List[str] | None = None,
     ignore_regexes: List[Pattern] | None = None,
     verbose: bool = False,
+    jobs: int | None = None,
 ) -> Tuple[int, List[str]]:
     """Scan source files and return (num_missing, messages).
 
@@ -101,25 +260,33 @@ def check_css_imports(
         ignore_substrings: Optional list of path substrings to ignore.
         ignore_regexes: Optional list of regex patterns to ignore.
         verbose: Print verbose output.
+        jobs: Number of reader threads (see `_thread_pool_size` for the default).
 
     Returns:
         A tuple `(num_missing, messages)` where `num_missing` is the number of
         missing CSS imports found and `messages` contains detailed strings.
     """
-    patterns = ["*.ts", "*.tsx", "*.js", "*.jsx"]
-    all_files = find_source_files(directory, patterns)
-
     if ignore_substrings is None:
         ignore_substrings = []
     if ignore_regexes is None:
         ignore_regexes = []
 
+    # Prune directories matching an ignore substring during the walk instead of
+    # only filtering the files found inside them. The regexes are only matched
+    # against file paths below: one such as `/test$` matches a directory but
+    # none of the files in it
+    patterns = ["*.ts", "*.tsx", "*.js", "*.jsx"]
+    all_files = find_source_files(
+        directory, patterns, ignore_substrings, exclude_patterns=SKIPPED_FILE_PATTERNS
+    )
+
     # Filter files according to ignore substrings and regexes
     src_files: List[Path] = []
     skipped = 0
+    is_ignored_path = _compile_substring_matcher(ignore_substrings)
     for p in all_files:
         path_text = str(p.as_posix())
-        if any(sub in path_text for sub in ignore_substrings):
+        if is_ignored_path(path_text):
             skipped += 1
             continue
         if any(rx.search(path_text) for rx in ignore_regexes):
@@ -138,6 +305,10 @@ def check_css_imports(
     # Print total count
     print(f"Checking {total_files} files for CSS imports...")
 
+    # Many files import the same assets, so each path is only stat'ed once.
+    # Threads may race to fill in the same entry, which only costs a stat.
+    exists_cache: Dict[str, bool] = {}
+
     def check_file(src: Path) -> List[str]:
         """Check a single file for missing CSS imports.
 
@@ -148,75 +319,101 @@ def check_css_imports(
             A list of message strings describing missing imports or read errors.
         """
         file_msgs: List[str] = []
+        src_dir = str(src.parent)
         try:
-            text = src.read_text(encoding="utf-8")
+            asset_imports = _scan_asset_imports(src)
         except Exception as e:
             return [f"Failed reading {src}: {e}"]
 
-            for lineno, line in enumerate(text.splitlines(), start=1):
-                import_path = None
-
-                for pat in IMPORT_PATTERNS:
-                    m = pat.search(line)
-                    if m:
-                        import_path = m.group("path")
-                        break
+        for lineno, import_path in asset_imports:
+            if not import_path:
+                continue
 
-                if not import_path:
-                    continue
+            # Normalize and ignore remote URLs
+            import_path_clean = import_path.split("?", 1)[0].split("#", 1)[0]
+            if import_path_clean.startswith(("http://", "https://")):
+                continue
 
-                # Normalize and ignore remote URLs
-                import_path_clean = import_path.split('?', 1)[0].split('#', 1)[0]
-                if import_path_clean.startswith(('http://', 'https://')):
+            # Only attempt to resolve relative or absolute filesystem paths.
+            # If the import does not start with '.' or '/', assume it's a module
+            # import and skip it.
+            try:
+                if import_path_clean.startswith("."):
+                    resolved = os.path.normpath(
+                        os.path.join(src_dir, import_path_clean)
+                    )
+                elif import_path_clean.startswith("/"):
+                    resolved = os.path.normpath(import_path_clean)
+                else:
+                    # Likely a package import (e.g., from an asset loader). Skip.
                     continue
 
-                # Only attempt to resolve relative or absolute filesystem paths.
-                # If the import does not start with '.' or '/', assume it's a module
-                # import and skip it.
-                try:
-                    if import_path_clean.startswith('.'):
-                        resolved = (src.parent / import_path_clean).resolve()
-                    elif import_path_clean.startswith('/'):
-                        resolved = Path(import_path_clean).resolve()
-                    else:
-                        # Likely a package import (e.g., from an asset loader). Skip.
-                        continue
-
-                    if not resolved.exists():
-                        file_msgs.append(
-                            f"{src} (line {lineno}): \nVisual asset not found: '{import_path}'\n"
-                        )
-                except Exception as e:
-                    file_msgs.append(f"Failed resolving {src} (line {lineno}): {e}")
+                exists = exists_cache.get(resolved)
+                if exists is None:
+                    exists = exists_cache[resolved] = os.path.exists(resolved)
+                if not exists:
+                    file_msgs.append(
+                        f"{src} (line {lineno}): \nVisual asset not found: '{import_path}'\n"
+                    )
+            except Exception as e:
+                file_msgs.append(f"Failed resolving {src} (line {lineno}): {e}")
 
         return file_msgs
 
-    # Use a ThreadPoolExecutor for IO-bound work (file reading)
-    max_workers = min(32, (os.cpu_count() or 1) * 5)
+    def check_batch(batch: List[Path]) -> List[str]:
+        """Check a batch of files, reporting per-file errors as messages."""
+        batch_msgs: List[str] = []
+        for src in batch:
+            try:
+                batch_msgs.extend(check_file(src))
+            except Exception as exc_err:
+                batch_msgs.append(f"Error checking {src}: {exc_err}")
+        return batch_msgs
+
+    # Use a ThreadPoolExecutor for IO-bound work (file reading). Files are
+    # handed out in batches so thousands of small files don't each pay for a
+    # future and a progress-bar redraw.
+    max_workers = _thread_pool_size(jobs)
+    batches = [
+        src_files[i : i + CHECK_BATCH_SIZE]
+        for i in range(0, total_files, CHECK_BATCH_SIZE)
+    ]
     checked = 0
     bar_width = 40
+    # Redraw the bar at most every PROGRESS_INTERVAL seconds on a terminal;
+    # when piped, print a plain line per 10% instead of carriage returns
+    interactive = sys.stdout.isatty()
+    last_update = 0.0
+    last_decile = 0
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as exc:
-        futures = {exc.submit(check_file, src): src for src in src_files}
+        futures = {exc.submit(check_batch, batch): batch for batch in batches}
 
         for fut in concurrent.futures.as_completed(futures):
-            checked += 1
-            try:
-                file_msgs = fut.result()
-            except Exception as exc_err:
-                missing_messages.append(f"Error checking {futures[fut]}: {exc_err}")
-                file_msgs = []
+            checked += len(futures[fut])
+            file_msgs = fut.result()
 
             if file_msgs:
                 missing_messages.extend(file_msgs)
 
             # update progress bar
-            progress = checked / total_files
-            filled = int(bar_width * progress)
-            bar = "#" * filled + "-" * (bar_width - filled)
-            print(f"\r[{bar}] {checked}/{total_files}", end="", flush=True)
-
-    print()
+            if interactive:
+                now = time.monotonic()
+                if now - last_update < PROGRESS_INTERVAL and checked < total_files:
+                    continue
+                last_update = now
+                progress = checked / total_files
+                filled = int(bar_width * progress)
+                bar = "#" * filled + "-" * (bar_width - filled)
+                print(f"\r[{bar}] {checked}/{total_files}", end="", flush=True)
+            else:
+                decile = checked * 10 // total_files
+                if decile > last_decile:
+                    last_decile = decile
+                    print(f"Checked {checked}/{total_files} files")
+
+    if interactive:
+        print()
 
     return len(missing_messages), missing_messages
 
@@ -260,6 +457,13 @@ def main(argv: List[str] | None = None) -> int:
         help="Ignore files whose path matches this regex. Can be provided multiple times.",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of threads reading files (default: THREAD_POOL_SIZE or 16 per CPU, at most 256)",
+    )
+
     args = parser.parse_args(argv)
     directory = Path(args.directory).resolve()
 
@@ -272,7 +476,11 @@ def main(argv: List[str] | None = None) -> int:
     ignore_regexes = compile_regex_list(args.ignore_regex)
 
     missing_count, messages = check_css_imports(
-        directory, ignore_substrings=ignore_substrings, ignore_regexes=ignore_regexes, verbose=args.verbose
+        directory,
+        ignore_substrings=ignore_substrings,
+        ignore_regexes=ignore_regexes,
+        verbose=args.verbose,
+        jobs=args.jobs,
     )
 
     if messages:
@@ -7,35 +7,28 @@ identifies packages that are not installed in node_modules, and installs them.
 It also updates the package.json file to include these newly installed packages.
 """
 
-import json
+import mmap
 import os
 import re
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 # Import shared utility functions
 from .utils import (
     check_types_package_exists,
     get_installed_packages,
     get_latest_package_version,
+    get_latest_package_versions,
+    read_json_file,
+    write_bytes_file,
+    write_json_file,
 )
 
-
-def find_js_ts_files(directory_path: str) -> List[str]:
-    """
-    Find all JavaScript and TypeScript files in a directory recursively.
-
-    Args:
-        directory_path: The root directory to search in.
-
-    Returns:
-        js_ts_files: A list of file paths to .js, .jsx, .ts, and .tsx files.
-    """
-    js_ts_files = []
-    # Directories to skip
-    excluded_dirs = {
+# Directories to skip when searching for source files
+EXCLUDED_DIRS = frozenset(
+    {
         "node_modules",
         ".next",
         ".idea",
@@ -45,118 +38,233 @@ def find_js_ts_files(directory_path: str) -> List[str]:
         "components",
         "src/components",
     }
+)
 
-    for root, dirs, files in os.walk(directory_path):
-        # Skip excluded directories by modifying dirs in-place
-        dirs[:] = [
-            d
-            for d in dirs
-            if d not in excluded_dirs
-            and not os.path.join(root, d).endswith("src/components")
-        ]
+# Extensions of the files scanned for imports
+JS_TS_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx")
+
+# Common npm package scopes; other @-prefixed imports are treated as path
+# aliases configured in tsconfig/jsconfig
+KNOWN_SCOPES = frozenset(
+    {
+        "@types",
+        "@babel",
+        "@angular",
+        "@vue",
+        "@react",
+        "@mui",
+        "@material",
+        "@testing-library",
+        "@storybook",
+        "@emotion",
+        "@jest",
+        "@aws",
+        "@microsoft",
+        "@apollo",
+        "@nestjs",
+        "@sentry",
+        "@chakra-ui",
+        "@next",
+        "@prisma",
+        "@stripe",
+        "@tanstack",
+        "@reduxjs",
+        "@fortawesome",
+    }
+)
 
-        for file in files:
-            if file.endswith((".js", ".jsx", ".ts", ".tsx")):
-                js_ts_files.append(os.path.join(root, file))
+# Generated files that match JS_TS_EXTENSIONS but are never worth scanning
+SKIPPED_SUFFIXES = (".min.js",)
+
+# Files at least this large are memory-mapped rather than read into memory
+MMAP_THRESHOLD = 4096
+
+# Leading bytes sniffed to recognise binary and minified files
+SNIFF_SIZE = 4096
+
+# Files larger than this whose first SNIFF_SIZE bytes hold no line break are
+# treated as minified bundles and not scanned
+MINIFIED_MIN_SIZE = 100 * 1024
+
+# Patterns for different types of imports, compiled once at import time.
+# They only match ASCII syntax, so they run on the raw file bytes. The text
+# between a keyword and its module specifier may only hold the names,
+# punctuation and whitespace of an import clause or destructuring pattern.
+# It can span lines (multi-line named imports) but never a quote, `;`, `=`
+# or `(`, so one match can't run past another statement and hide it.
+# ES6 import patterns
+ES6_IMPORT_PATTERNS = [
+    re.compile(rb'import\s+[\'"]([^./][^\'"]*)(?:/[^\'"]*)??[\'"]'),  # import 'package'
+    re.compile(
+        rb'import\s+[\w$\s{},*]*?\s+from\s+[\'"]([^./][^\'"]*)(?:/[^\'"]*)??[\'"]'
+    ),  # import x from 'package'
+    re.compile(
+        rb'export\s+[\w$\s{},*]*?\s+from\s+[\'"]([^./][^\'"]*)(?:/[^\'"]*)??[\'"]'
+    ),  # export x from 'package'
+]
+
+# CommonJS require pattern
+REQUIRE_RE = re.compile(
+    rb'(?:const|let|var)\s+[\w$\s{},:\[\]]*?=\s*require\s*\(\s*[\'"]([^./][^\'"]*)(?:/[^\'"]*)??[\'"]\s*\)'
+)
 
-    return js_ts_files
+# Dynamic import pattern
+DYNAMIC_IMPORT_RE = re.compile(
+    rb'import\s*\(\s*[\'"]([^./][^\'"]*)(?:/[^\'"]*)??[\'"]\s*\)'
+)
 
+# All of the above fused into one alternation so each file is scanned once.
+# Every alternative has exactly one capturing group (the package name).
+ALL_IMPORTS_RE = re.compile(
+    b"|".join(
+        b"(?:" + pattern.pattern + b")"
+        for pattern in ES6_IMPORT_PATTERNS + [REQUIRE_RE, DYNAMIC_IMPORT_RE]
+    )
+)
 
-def extract_imports(file_path: str) -> Set[str]:
+
+def find_js_ts_files(directory_path: str) -> List[str]:
     """
-    Extract import/require statements from a JavaScript or TypeScript file.
+    Find all JavaScript and TypeScript files in a directory recursively.
 
     Args:
-        file_path: Path to the JS/TS file.
+        directory_path: The root directory to search in.
 
     Returns:
-        clean_imports: Set of package names that are being imported.
+        js_ts_files: A list of file paths to .js, .jsx, .ts, and .tsx files.
     """
-    imports = set()
+    # Bind the constants locally; the walk looks them up once per entry
+    excluded_dirs = EXCLUDED_DIRS
+    extensions = JS_TS_EXTENSIONS
+    skipped_suffixes = SKIPPED_SUFFIXES
+
+    def _walk(path: str):
+        # Read the whole listing up front so the directory handle is closed
+        # before recursing (keeps open file descriptors bounded on deep trees)
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
 
-    # Patterns for different types of imports
-    # ES6 import patterns
-    es6_patterns = [
-        r'import\s+.*\s+from\s+[\'"]([^./][^\'"]*)(?:/[^\'"]*)??[\'"]',  # import x from 'package'
-        r'import\s+[\'"]([^./][^\'"]*)(?:/[^\'"]*)??[\'"]',  # import 'package'
-        r'export\s+.*\s+from\s+[\'"]([^./][^\'"]*)(?:/[^\'"]*)??[\'"]',  # export x from 'package'
-    ]
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Prune excluded directories before descending into them
+                if entry.name in excluded_dirs or entry.path.endswith("src/components"):
+                    continue
+                yield from _walk(entry.path)
+            elif entry.name.endswith(extensions) and not entry.name.endswith(
+                skipped_suffixes
+            ):
+                yield entry.path
 
-    # CommonJS require pattern
-    require_pattern = r'(?:const|let|var)\s+.*\s*=\s*require\s*\(\s*[\'"]([^./][^\'"]*)(?:/[^\'"]*)??[\'"]\s*\)'
+    return list(_walk(directory_path))
 
-    # Dynamic import pattern
-    dynamic_import = r'import\s*\(\s*[\'"]([^./][^\'"]*)(?:/[^\'"]*)??[\'"]\s*\)'
 
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+def _scan_imports(file_path: str) -> Tuple[Set[str], List[str], Optional[str]]:
+    """
+    Extract the imported package names from a file without printing anything.
+
+    Safe to run in worker processes; the caller reports the skipped aliases and
+    the read error.
+
+    Args:
+        file_path: Path to the JS/TS file.
+
+    Returns:
+        A tuple `(clean_imports, skipped_aliases, error)`: the package names, the
+        imports skipped as likely path aliases, and the error message if the
+        file couldn't be read (None otherwise).
+    """
+    imports = set()
+    error = None
 
-            # Check all ES6 import patterns
-            for pattern in es6_patterns:
-                for match in re.finditer(pattern, content):
-                    imports.add(match.group(1))
+    try:
+        # Scan raw bytes; only the captured package names need decoding. Large
+        # (e.g. bundled or vendored) files are memory-mapped instead of copied.
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < MMAP_THRESHOLD:
+                content = f.read()
+            else:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
-            # Check CommonJS require pattern
-            for match in re.finditer(require_pattern, content):
-                imports.add(match.group(1))
+        try:
+            head = content[:SNIFF_SIZE]
+            if b"\x00" in head or (size > MINIFIED_MIN_SIZE and b"\n" not in head):
+                return set(), [], None
 
-            # Check dynamic import pattern
-            for match in re.finditer(dynamic_import, content):
-                imports.add(match.group(1))
+            # Single pass over the content for every import style
+            for match in ALL_IMPORTS_RE.finditer(content):
+                imports.add(match.group(match.lastindex).decode("utf-8"))
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
 
     except Exception as e:
-        print(f"Error reading {file_path}: {str(e)}")
+        error = f"Error reading {file_path}: {str(e)}"
 
     # Clean up package names (handle scoped packages and subpaths)
     clean_imports = set()
-    for imp in imports:
+    skipped_aliases = []
+    for imp in sorted(imports):
         if imp.startswith("@"):
             # Only consider standard scoped packages (like @types/node, @babel/core)
             # Skip imports starting with @ that are likely path aliases
-            parts = imp.split("/")
+            parts = imp.split("/", 2)
             if len(parts) >= 2:
-                # List of common npm scoped packages prefixes to include
-                known_scopes = {
-                    "@types",
-                    "@babel",
-                    "@angular",
-                    "@vue",
-                    "@react",
-                    "@mui",
-                    "@material",
-                    "@testing-library",
-                    "@storybook",
-                    "@emotion",
-                    "@jest",
-                    "@aws",
-                    "@microsoft",
-                    "@apollo",
-                    "@nestjs",
-                    "@sentry",
-                    "@chakra-ui",
-                    "@next",
-                    "@prisma",
-                    "@stripe",
-                    "@tanstack",
-                    "@reduxjs",
-                    "@fortawesome",
-                }
-
-                if parts[0] in known_scopes:
+                if parts[0] in KNOWN_SCOPES:
                     clean_imports.add(f"{parts[0]}/{parts[1]}")
                 else:
                     # Skip other @ imports as they're likely path aliases configured in tsconfig/jsconfig
-                    print(f"  Skipping likely path alias: {imp}")
+                    skipped_aliases.append(imp)
         else:
             # For regular packages, just capture the package name
-            clean_imports.add(imp.split("/")[0])
+            clean_imports.add(imp.split("/", 1)[0])
+
+    return clean_imports, skipped_aliases, error
+
+
+def extract_imports(file_path: str) -> Set[str]:
+    """
+    Extract import/require statements from a JavaScript or TypeScript file.
+
+    Binary files (a NUL byte near the start) and minified bundles (no line
+    break near the start of a large file) yield no imports.
+
+    Args:
+        file_path: Path to the JS/TS file.
 
+    Returns:
+        clean_imports: Set of package names that are being imported.
+    """
+    clean_imports, skipped_aliases, error = _scan_imports(file_path)
+    if error:
+        print(error)
+    for imp in skipped_aliases:
+        print(f"  Skipping likely path alias: {imp}")
     return clean_imports
 
 
+def _print_npm_output(result: subprocess.CompletedProcess, verbose: bool) -> None:
+    """
+    Print what a successful npm call wrote: warnings always, the rest with `verbose`.
+
+    Args:
+        result: The completed npm process, run with captured text output.
+        verbose: Also print npm's stdout.
+    """
+    if verbose and result.stdout and result.stdout.strip():
+        print(result.stdout.strip())
+    if result.stderr and result.stderr.strip():
+        print(result.stderr.strip())
+
+
 def install_package(
-    package_name: str, directory_path: str, is_dev_dependency: bool = False
+    package_name: str,
+    directory_path: str,
+    is_dev_dependency: bool = False,
+    verbose: bool = False,
 ) -> Tuple[bool, str]:
     """
     Install a package with its latest version to the specific directory.
@@ -165,6 +273,7 @@ def install_package(
         package_name: The name of the package to install.
         directory_path: The directory where the package should be installed.
         is_dev_dependency: Whether to install as a dev dependency.
+        verbose: Print npm's full output, not just its warnings.
 
     Returns:
         A tuple `(success, version)` where `success` is a boolean indicating if the
@@ -174,42 +283,167 @@ def install_package(
         latest_version = get_latest_package_version(package_name)
         print(f"  Latest version of {package_name}: {latest_version}")
 
-        # Get the current directory to return to it later
-        original_dir = os.getcwd()
-
-        try:
-            # Change to the target directory before running npm
-            os.chdir(directory_path)
-            print(f"  Installing to directory: {directory_path}")
+        print(f"  Installing to directory: {directory_path}")
 
-            # Construct the install command
-            install_flag = "--save-dev" if is_dev_dependency else ""
-            install_cmd = f"npm install {package_name}@{latest_version} {install_flag}"
+        # Construct the install command
+        install_cmd = ["npm", "install", f"{package_name}@{latest_version}"]
+        if is_dev_dependency:
+            install_cmd.append("--save-dev")
 
-            # Run the installation command
-            subprocess.check_call(install_cmd, shell=True)
-
-            print(
-                f"  ✅ Installed {package_name}@{latest_version} {'as dev dependency' if is_dev_dependency else ''}"
-            )
-            return True, latest_version
+        # Run npm in the target directory without touching the process-wide cwd
+        result = subprocess.run(
+            install_cmd, cwd=directory_path, check=True, capture_output=True, text=True
+        )
+        _print_npm_output(result, verbose)
 
-        finally:
-            # Always change back to the original directory
-            os.chdir(original_dir)
+        print(
+            f"  ✅ Installed {package_name}@{latest_version} {'as dev dependency' if is_dev_dependency else ''}"
+        )
+        return True, latest_version
 
     except subprocess.CalledProcessError as e:
         print(f"  ❌ Failed to install {package_name}: {str(e)}")
+        if e.stderr:
+            print(e.stderr.strip())
         return False, ""
     except Exception as e:
         print(f"  ❌ Error installing {package_name}: {str(e)}")
         return False, ""
 
 
+def install_packages(
+    package_names: List[str],
+    directory_path: str,
+    is_dev_dependency: bool = False,
+    verbose: bool = False,
+) -> Dict[str, str]:
+    """
+    Install several packages with their latest versions using a single npm call.
+
+    Latest versions are looked up concurrently and written to package.json, then
+    a bare `npm install` resolves the whole dependency tree in one pass. If that
+    fails, package.json is restored and each package is installed on its own so
+    one bad package does not block the rest. package.json is updated either way.
+
+    Args:
+        package_names: The names of the packages to install.
+        directory_path: The directory where the packages should be installed.
+        is_dev_dependency: Whether to install as dev dependencies.
+        verbose: Print npm's full output, not just its warnings.
+
+    Returns:
+        successfully_installed: Dictionary of installed package names and their versions.
+    """
+    if not package_names:
+        return {}
+
+    # Registry lookups are network bound, so they run concurrently
+    lookup_errors: Dict[str, Exception] = {}
+    latest_versions = get_latest_package_versions(package_names, lookup_errors)
+    for package_name in package_names:
+        if package_name in latest_versions:
+            print(
+                f"  Latest version of {package_name}: {latest_versions[package_name]}"
+            )
+        else:
+            print(
+                f"  ❌ Error installing {package_name}: {str(lookup_errors[package_name])}"
+            )
+
+    if not latest_versions:
+        return {}
+
+    print(f"  Installing to directory: {directory_path}")
+
+    # Keep the original manifest so a failed install can be rolled back
+    package_json_path = os.path.join(directory_path, "package.json")
+    original_package_json = None
+    if os.path.isfile(package_json_path):
+        with open(package_json_path, "rb") as f:
+            original_package_json = f.read()
+
+    # Declare every package in package.json, then let npm resolve and fetch
+    # the full tree in one invocation. The update is only reported once the
+    # install has succeeded, as a failed one is rolled back
+    if is_dev_dependency:
+        declared = update_package_json(directory_path, {}, latest_versions, quiet=True)
+    else:
+        declared = update_package_json(directory_path, latest_versions, quiet=True)
+
+    if declared:
+        try:
+            result = subprocess.run(
+                ["npm", "install"],
+                cwd=directory_path,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except subprocess.CalledProcessError as e:
+            print(f"  Batched install failed ({str(e)})")
+            if e.stderr:
+                print(e.stderr.strip())
+        else:
+            _print_npm_output(result, verbose)
+            for package_name, version in latest_versions.items():
+                print(
+                    f"  ✅ Installed {package_name}@{version} {'as dev dependency' if is_dev_dependency else ''}"
+                )
+            if is_dev_dependency:
+                _print_package_json_update({}, latest_versions)
+            else:
+                _print_package_json_update(latest_versions, {})
+            return latest_versions
+
+        # Drop the entries again so the fallback only records what installed
+        if original_package_json is None:
+            os.remove(package_json_path)
+        else:
+            write_bytes_file(package_json_path, original_package_json)
+
+    # npm installs into the same directory can't safely overlap, so the
+    # fallback installs the packages one after another
+    print("  Installing packages one by one...")
+    successfully_installed = {}
+    for package_name in latest_versions:
+        success, version = install_package(
+            package_name, directory_path, is_dev_dependency, verbose
+        )
+        if success:
+            successfully_installed[package_name] = version
+
+    if successfully_installed:
+        if is_dev_dependency:
+            update_package_json(directory_path, {}, successfully_installed)
+        else:
+            update_package_json(directory_path, successfully_installed)
+    return successfully_installed
+
+
+def _print_package_json_update(
+    installed_packages: Dict[str, str], dev_dependencies: Dict[str, str]
+) -> None:
+    """
+    Report the packages added to package.json.
+
+    Args:
+        installed_packages: Packages added to dependencies.
+        dev_dependencies: Packages added to devDependencies.
+    """
+    summary = []
+    if installed_packages:
+        summary.append(f"{len(installed_packages)} new dependencies")
+    if dev_dependencies:
+        summary.append(f"{len(dev_dependencies)} new devDependencies")
+
+    print(f"✅ Updated package.json with {' and '.join(summary)}")
+
+
 def update_package_json(
     directory_path: str,
     installed_packages: Dict[str, str],
     dev_dependencies: Dict[str, str] = None,
+    quiet: bool = False,
 ) -> bool:
     """
     Update package.json to include the newly installed packages.
@@ -218,6 +452,8 @@ def update_package_json(
         directory_path: Path to the directory containing package.json.
         installed_packages: Dictionary of package names and their versions for dependencies.
         dev_dependencies: Dictionary of package names and their versions for devDependencies.
+        quiet: Don't report a successful update, e.g. when it may still be
+            rolled back. Errors are printed regardless.
 
     Returns:
         True if package.json was updated successfully, False otherwise.
@@ -230,9 +466,10 @@ def update_package_json(
     try:
         # Check if package.json exists
         if not os.path.isfile(package_json_path):
-            print(
-                f"package.json not found at {package_json_path}. Creating new file..."
-            )
+            if not quiet:
+                print(
+                    f"package.json not found at {package_json_path}. Creating new file..."
+                )
             package_json = {
                 "name": os.path.basename(directory_path),
                 "version": "1.0.0",
@@ -242,8 +479,7 @@ def update_package_json(
             }
         else:
             # Load existing package.json
-            with open(package_json_path, "r", encoding="utf-8") as f:
-                package_json = json.load(f)
+            package_json = read_json_file(package_json_path)
 
         # Ensure dependencies section exists
         if "dependencies" not in package_json:
@@ -264,17 +500,10 @@ def update_package_json(
                 package_json["devDependencies"][pkg_name] = f"^{version}"
 
         # Write updated package.json
-        with open(package_json_path, "w", encoding="utf-8") as f:
-            json.dump(package_json, f, indent=2)
-            f.write("\n")  # Add newline at end of file
+        write_json_file(package_json_path, package_json)
 
-        summary = []
-        if installed_packages:
-            summary.append(f"{len(installed_packages)} new dependencies")
-        if dev_dependencies:
-            summary.append(f"{len(dev_dependencies)} new devDependencies")
-
-        print(f"✅ Updated package.json with {' and '.join(summary)}")
+        if not quiet:
+            _print_package_json_update(installed_packages, dev_dependencies)
         return True
 
     except Exception as e:
@@ -282,13 +511,16 @@ def update_package_json(
         return False
 
 
-def check_and_install_missing_packages(directory_path: str) -> None:
+def check_and_install_missing_packages(
+    directory_path: str, verbose: bool = False
+) -> None:
     """
     Check for packages imported in JS/TS files that are not installed and install them.
     Also updates package.json with the newly installed packages.
 
     Args:
         directory_path: Path to the directory to scan.
+        verbose: Print the imports found in every file and npm's full output.
 
     Raises:
         FileNotFoundError: If the directory is not found.
@@ -313,32 +545,40 @@ def check_and_install_missing_packages(directory_path: str) -> None:
 
         print(f"Found {len(js_ts_files)} JavaScript/TypeScript files to analyze.\n")
 
-        # Get all installed packages
+        # Get all installed packages once; both install stages share the set
         installed_packages = get_installed_packages(directory_path)
 
         # Collect all imported packages from all files
         all_imports = set()
 
-        for file_path in js_ts_files:
-            # Get relative path for display
-            rel_path = os.path.relpath(file_path, directory_path)
-            print(f"Analyzing imports in {rel_path}")
+        # Extract imports in worker processes; results come back in file order
+        # so all reporting stays in the parent process
+        with ProcessPoolExecutor() as executor:
+            for file_path, (file_imports, skipped_aliases, error) in zip(
+                js_ts_files,
+                executor.map(_scan_imports, js_ts_files, chunksize=32),
+            ):
+                all_imports.update(file_imports)
+                if error:
+                    print(error)
+                if not verbose:
+                    continue
 
-            # Extract imports from this file
-            file_imports = extract_imports(file_path)
+                # Get relative path for display
+                rel_path = os.path.relpath(file_path, directory_path)
+                print(f"Analyzing imports in {rel_path}")
 
-            if file_imports:
-                print(
-                    f"  Found {len(file_imports)} import(s): {', '.join(file_imports)}"
-                )
-                all_imports.update(file_imports)
-            else:
-                print("  No imports found")
+                for imp in skipped_aliases:
+                    print(f"  Skipping likely path alias: {imp}")
+                if file_imports:
+                    print(
+                        f"  Found {len(file_imports)} import(s): {', '.join(file_imports)}"
+                    )
+                else:
+                    print("  No imports found")
 
         # Find missing packages
-        missing_packages = [
-            pkg for pkg in all_imports if pkg not in installed_packages and pkg != ""
-        ]
+        missing_packages = sorted(all_imports - installed_packages - {""})
 
         if not missing_packages:
             print("\nAll imported packages are already installed!")
@@ -350,25 +590,15 @@ def check_and_install_missing_packages(directory_path: str) -> None:
             # Confirm installation
             print("\nInstalling missing packages...")
 
-            # Track successfully installed packages for package.json update
-            successfully_installed = {}
+            # Install all missing packages; package.json is updated with the
+            # successful ones along the way
+            successfully_installed = install_packages(
+                missing_packages, directory_path, verbose=verbose
+            )
 
-            # Install all missing packages
             for package_name in missing_packages:
-                try:
-                    print(f"Processing {package_name}...")
-                    # Pass directory_path to install_package
-                    success, version = install_package(package_name, directory_path)
-                    if success:
-                        successfully_installed[package_name] = version
-                    else:
-                        print(f"  Failed to install {package_name}")
-                except Exception as e:
-                    print(f"  Error processing {package_name}: {str(e)}")
-
-            # Update package.json with the newly installed packages
-            if successfully_installed:
-                update_package_json(directory_path, successfully_installed)
+                if package_name not in successfully_installed:
+                    print(f"  Failed to install {package_name}")
 
         # Check for TypeScript types packages regardless of whether regular packages were installed
         has_typescript_files = any(
@@ -376,15 +606,11 @@ def check_and_install_missing_packages(directory_path: str) -> None:
         )
 
         if has_typescript_files:
-            # Get all installed types packages
+            # Install any missing types packages (also added to package.json)
             successfully_installed_types = check_and_install_types_packages(
-                directory_path, all_imports
+                directory_path, all_imports, installed_packages, verbose
             )
 
-            # Update package.json with any installed types packages
-            if successfully_installed_types:
-                update_package_json(directory_path, {}, successfully_installed_types)
-
         print("\n----- SUMMARY -----")
         print(f"Scanned {len(js_ts_files)} JavaScript/TypeScript files")
         print(f"Found {len(all_imports)} unique package imports")
@@ -416,7 +642,10 @@ def check_and_install_missing_packages(directory_path: str) -> None:
 
 
 def check_and_install_types_packages(
-    directory_path: str, import_packages: Set[str]
+    directory_path: str,
+    import_packages: Set[str],
+    installed_packages: Optional[FrozenSet[str]] = None,
+    verbose: bool = False,
 ) -> Dict[str, str]:
     """
     Check for missing @types packages and install them as dev dependencies.
@@ -424,12 +653,15 @@ def check_and_install_types_packages(
     Args:
         directory_path: Path to the directory to scan.
         import_packages: Set of package names that are imported in the code.
+        installed_packages: Packages already in node_modules, as returned by
+            `get_installed_packages`. Looked up if not given.
+        verbose: Print npm's full output, not just its warnings.
 
     Returns:
         successfully_installed: Dictionary of successfully installed @types packages and their versions.
     """
-    # Get all installed packages
-    installed_packages = get_installed_packages(directory_path)
+    if installed_packages is None:
+        installed_packages = get_installed_packages(directory_path)
 
     # Filter packages to only include those that might need @types
     # Skip packages that are already @types packages
@@ -444,18 +676,28 @@ def check_and_install_types_packages(
 
     print("\nChecking for available TypeScript type definitions (@types packages)...")
 
-    for package_name in potential_types_packages:
+    packages_to_check = []
+    for package_name in sorted(potential_types_packages):
         types_package = f"@types/{package_name}"
 
         # Skip if types package is already installed
         if types_package in installed_packages:
             print(f"  {types_package} is already installed")
             continue
-
-        # Check if types package exists in npm registry
-        if check_types_package_exists(package_name):
-            missing_types_packages.append(types_package)
-            print(f"  Found available type definitions: {types_package}")
+        packages_to_check.append(package_name)
+
+    # Check which types packages exist in the npm registry; each check is a
+    # network round trip, so run them concurrently
+    if packages_to_check:
+        with ThreadPoolExecutor(
+            max_workers=min(32, len(packages_to_check))
+        ) as executor:
+            types_exist = executor.map(check_types_package_exists, packages_to_check)
+            for package_name, exists in zip(packages_to_check, types_exist):
+                if exists:
+                    types_package = f"@types/{package_name}"
+                    missing_types_packages.append(types_package)
+                    print(f"  Found available type definitions: {types_package}")
 
     if not missing_types_packages:
         print("No missing @types packages found.")
@@ -467,23 +709,15 @@ def check_and_install_types_packages(
 
     print("\nInstalling @types packages as dev dependencies...")
 
-    # Track successfully installed packages for package.json update
-    successfully_installed = {}
+    # Install all missing @types packages with a single npm call and record
+    # the successful ones in package.json devDependencies
+    successfully_installed = install_packages(
+        missing_types_packages, directory_path, is_dev_dependency=True, verbose=verbose
+    )
 
-    # Install all missing @types packages
     for package_name in missing_types_packages:
-        try:
-            print(f"Processing {package_name}...")
-            # Install as a dev dependency
-            success, version = install_package(
-                package_name, directory_path, is_dev_dependency=True
-            )
-            if success:
-                successfully_installed[package_name] = version
-            else:
-                print(f"  Failed to install {package_name}")
-        except Exception as e:
-            print(f"  Error processing {package_name}: {str(e)}")
+        if package_name not in successfully_installed:
+            print(f"  Failed to install {package_name}")
 
     return successfully_installed
 
@@ -497,14 +731,18 @@ def main() -> None:
         print("jsmonitor-installer v0.2.0")
         sys.exit(0)
 
-    if len(sys.argv) > 1 and not sys.argv[1].startswith("-"):
-        directory_path = os.path.abspath(sys.argv[1])
+    # -v is taken by --version, so verbose output only has the long flag
+    verbose = "--verbose" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--verbose"]
+
+    if args and not args[0].startswith("-"):
+        directory_path = os.path.abspath(args[0])
     else:
-        print("Usage: jsmonitor-installer [--version] <path-to-directory>")
+        print("Usage: jsmonitor-installer [--version] [--verbose] <path-to-directory>")
         print("If no path is provided, the current directory will be used.")
         directory_path = os.getcwd()
 
-    check_and_install_missing_packages(directory_path)
+    check_and_install_missing_packages(directory_path, verbose=verbose)
 
 
 if __name__ == "__main__":
@@ -6,18 +6,22 @@ This script updates dependencies and devDependencies in a package.json file to t
 It fetches the latest versions from the npm registry and updates the package.json file with the "^" prefix.
 """
 
-import json
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 
 # Import shared utility functions
-from .utils import get_latest_package_version
+from .utils import get_latest_package_version, read_json_file, write_json_file
 
 
 def update_dependency(
-    package_name: str, current_version: str, dependency_dict: Dict[str, str]
+    package_name: str,
+    current_version: str,
+    dependency_dict: Dict[str, str],
+    out_of_date: Optional[List[Tuple[str, str, str]]] = None,
+    lock: Optional[threading.Lock] = None,
 ) -> bool:
     """
     Update a single dependency with its latest version.
@@ -26,6 +30,9 @@ def update_dependency(
         package_name: The name of the package to update.
         current_version: The current version string in package.json.
         dependency_dict: The dictionary of dependencies to modify.
+        out_of_date: Optional list collecting `(package_name, current_version, latest_version)`
+            for packages that were out of date.
+        lock: Optional lock guarding `out_of_date` when called from several threads.
 
     Returns:
         True if update was successful, False otherwise.
@@ -44,6 +51,13 @@ def update_dependency(
             print(
                 f"  {package_name}: {current_version} → ^{latest_version} [OUT OF DATE]"
             )
+            if out_of_date is not None:
+                entry = (package_name, current_version, latest_version)
+                if lock is None:
+                    out_of_date.append(entry)
+                else:
+                    with lock:
+                        out_of_date.append(entry)
         else:
             print(f"  {package_name}: {current_version} → ^{latest_version} [CURRENT]")
 
@@ -53,30 +67,42 @@ def update_dependency(
         return False
 
 
-def update_dependency_section(section: Dict[str, str], section_name: str):
+def update_dependency_section(
+    section: Dict[str, str],
+    section_name: str,
+    out_of_date: Optional[List[Tuple[str, str, str]]] = None,
+    lock: Optional[threading.Lock] = None,
+):
     """
     Update all dependencies in a section (dependencies or devDependencies).
 
     Args:
         section: The dictionary of dependencies to update.
         section_name: The name of the section (for logging).
+        out_of_date: Optional list collecting packages that were out of date.
+        lock: Optional lock guarding `out_of_date`.
     """
     if not section:
         return
 
     print(f"Updating {section_name}...")
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = []
-        for package_name, current_version in section.items():
-            futures.append(
-                executor.submit(
-                    update_dependency, package_name, current_version, section
-                )
+    # Registry lookups are network bound, so allow plenty of concurrent requests
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        futures = [
+            executor.submit(
+                update_dependency,
+                package_name,
+                current_version,
+                section,
+                out_of_date,
+                lock,
             )
+            for package_name, current_version in list(section.items())
+        ]
 
-        # Wait for all updates to complete
-        for future in futures:
+        # Handle each update as soon as it completes
+        for future in as_completed(futures):
             future.result()
 
 
@@ -104,67 +130,30 @@ def update_package_versions(directory_path: str) -> None:
         if not os.path.isfile(package_json_path):
             raise FileNotFoundError(f"package.json not found in {directory_path}")
 
-        with open(package_json_path, "r", encoding="utf-8") as f:
-            package_json = json.load(f)
+        package_json = read_json_file(package_json_path)
 
         print(f"\nChecking dependencies in: {package_json_path}\n")
 
         # Store out-of-date packages for summary
         out_of_date: List[Tuple[str, str, str]] = []
 
-        # Track callback to collect out-of-date packages
-        def track_outdated(
-            package_name: str, current_version: str, latest_version: str
-        ) -> None:
-            clean_current = current_version.lstrip("^~>=<")
-            if clean_current != latest_version:
-                out_of_date.append((package_name, current_version, latest_version))
-
-        # Modify dependency sections to track out-of-date packages
-        global update_dependency
-        original_update = update_dependency
-
-        def tracked_update(
-            package_name: str, current_version: str, dependency_dict: Dict[str, str]
-        ) -> bool:
-            try:
-                latest_version = get_latest_package_version(package_name)
-                clean_current = current_version.lstrip("^~>=<")
-                dependency_dict[package_name] = f"^{latest_version}"
-
-                if clean_current != latest_version:
-                    print(
-                        f"  {package_name}: {current_version} → ^{latest_version} [OUT OF DATE]"
-                    )
-                    out_of_date.append((package_name, current_version, latest_version))
-                else:
-                    print(
-                        f"  {package_name}: {current_version} → ^{latest_version} [CURRENT]"
-                    )
-
-                return True
-            except Exception as e:
-                print(f"  Failed to update {package_name}: {str(e)}")
-                return False
-
-        # Replace function temporarily
-        update_dependency = tracked_update
+        lock = threading.Lock()
 
         # Update dependencies
-        update_dependency_section(package_json.get("dependencies", {}), "dependencies")
+        update_dependency_section(
+            package_json.get("dependencies", {}), "dependencies", out_of_date, lock
+        )
 
         # Update devDependencies
         update_dependency_section(
-            package_json.get("devDependencies", {}), "devDependencies"
+            package_json.get("devDependencies", {}),
+            "devDependencies",
+            out_of_date,
+            lock,
         )
 
-        # Restore original function
-        update_dependency = original_update
-
         # Write updated package.json
-        with open(package_json_path, "w", encoding="utf-8") as f:
-            json.dump(package_json, f, indent=2)
-            f.write("\n")  # Add newline at end of file
+        write_json_file(package_json_path, package_json)
 
         # Print summary of out-of-date packages
         print("\n----- SUMMARY -----")
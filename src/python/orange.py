@@ -5,29 +5,63 @@ Uses a regex-based approach to sort imports in JavaScript/JSX files.
 """
 
 import argparse
+import functools
+import json
+import os
+import re
+import socket
 import subprocess
 import sys
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .utils import read_json_file, write_bytes_file, write_json_file
+
+# File extensions formatted when none are given
+DEFAULT_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx", ".vue", ".css", ".html", ".json")
+
+# Longest command line (in characters) handed to a single Prettier process.
+# On Windows prettier.cmd goes through cmd.exe, which caps the whole line at
+# 8191 characters; elsewhere this stays well under ARG_MAX
+PRETTIER_MAX_CMD_LENGTH = 7000 if sys.platform == "win32" else 100_000
+
+# File names in `prettier --check` output ("[warn] src/a.ts"), skipping the
+# closing "[warn] Code style issues found in ..." summary line
+PRETTIER_WARN_RE = re.compile(
+    r"^\[warn\][ \t]+(?!Code style issues found in)(\S(?:.*\S)?)", re.MULTILINE
+)
+
+# Directories Prettier never descends into on its own
+IGNORED_DIR_NAMES = frozenset({"node_modules", ".git", ".hg", ".svn"})
+
+# File the prettier_d_slim server writes its port and access token to
+PRETTIER_D_STATE_FILE = os.path.join(os.path.expanduser("~"), ".prettier_d_slim")
+
+# Seconds to wait for a freshly started prettier_d_slim server to come up
+PRETTIER_D_START_TIMEOUT = 10.0
+
+# Seconds a single request to the prettier_d_slim server may take
+PRETTIER_D_REQUEST_TIMEOUT = 60.0
+
+# Trailer the server appends to the reply of a request that failed
+PRETTIER_D_EXIT_RE = re.compile(rb"(?:\A|\n)# exit (\d+)\Z")
 
 
 def format_with_prettier(
     directory: Union[str, Path],
-    file_extensions: List[str] = [
-        ".js",
-        ".jsx",
-        ".ts",
-        ".tsx",
-        ".vue",
-        ".css",
-        ".html",
-        ".json",
-    ],
+    file_extensions: Sequence[str] = DEFAULT_EXTENSIONS,
     prettier_config: Optional[str] = None,
     ignore_path: Optional[str] = None,
     check_only: bool = False,
     verbose: bool = False,
     auto_install: bool = True,
+    use_cache: bool = True,
+    cache_strategy: str = "metadata",
+    jobs: int = 1,
+    daemon: bool = False,
 ) -> Tuple[bool, str]:
     """
     Format JavaScript/TypeScript files in a directory using Prettier.
@@ -40,6 +74,17 @@ def format_with_prettier(
         check_only: Only check if files are formatted (don't modify files).
         verbose: Print verbose output.
         auto_install: Automatically install Prettier if not found.
+        use_cache: Let Prettier skip files that haven't changed since the last run
+            (formatting only; checks always read every file).
+        cache_strategy: How Prettier detects unchanged files: "metadata"
+            (modification time and size) or "content" (file hash, stable on
+            fresh checkouts such as CI).
+        jobs: Number of parallel Prettier workers. Values above 1 use pprettier
+            (@mixer/parallel-prettier) when it is installed and no config file
+            has to be passed; otherwise the files are split over that many
+            Prettier processes.
+        daemon: Format through a long-lived prettier_d_slim server instead of
+            starting a new Prettier process for the run.
 
     Returns:
         A tuple `(success, message)` where `success` is a boolean indicating
@@ -50,18 +95,11 @@ def format_with_prettier(
             return False, f"Directory not found: {directory}"
 
         # Check if prettier is installed
-        try:
-            subprocess.run(
-                ["npx", "--no-install", "prettier", "--version"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-        except subprocess.CalledProcessError:
+        if _prettier_version(str(directory)) is None:
             if auto_install:
                 # Try to install prettier automatically
                 print("Checking for Prettier install...")
-                if not ensure_prettier_installed(directory, verbose):
+                if not ensure_prettier_installed(directory, verbose, daemon=daemon):
                     return (
                         False,
                         "Failed to automatically install Prettier. Please run 'npm install --save-dev prettier' first.",
@@ -72,56 +110,105 @@ def format_with_prettier(
                     "Prettier is not installed. Run 'npm install --save-dev prettier' first.",
                 )
 
-        # Build pattern for file extensions
-        pattern = f"**/*{{{','.join([ext.lstrip('.') for ext in file_extensions])}}}"  # Build command
-        cmd = ["npx", "prettier"]
+        if daemon:
+            daemon_result = _format_with_daemon(
+                directory,
+                file_extensions,
+                prettier_config=prettier_config,
+                ignore_path=ignore_path,
+                check_only=check_only,
+                verbose=verbose,
+            )
+            if daemon_result is not None:
+                return daemon_result
+            print("prettier_d_slim server not reachable, running Prettier directly")
 
-        if check_only:
-            cmd.append("--check")
-        else:
-            cmd.append("--write")
-        # Check for default prettier config
-        default_config = Path(__file__).parent.parent.parent / ".prettierrc"
-        has_default_config = default_config.exists()
-
-        if prettier_config:
-            cmd.extend(["--config", prettier_config])
-        elif has_default_config:
-            cmd.extend(["--config", str(default_config)])
-            if verbose:
-                print(f"Using default prettier config: {default_config}")
+        # List the files here rather than passing a glob, so Node doesn't walk
+        # the tree again (and never descends into node_modules)
+        files = [
+            os.path.relpath(file_path, str(directory))
+            for file_path in _iter_source_files(directory, file_extensions)
+        ]
+        if not files:
+            return True, "No files to format."
 
-        if ignore_path:
-            cmd.extend(["--ignore-path", ignore_path])
+        base_cmd, parallel = _build_prettier_cmd(
+            directory,
+            [],
+            prettier_config=prettier_config,
+            ignore_path=ignore_path,
+            check_only=check_only,
+            verbose=verbose,
+            use_cache=use_cache,
+            cache_strategy=cache_strategy,
+            jobs=jobs,
+        )
 
-        # Add the pattern to find files
-        cmd.append(pattern)
+        # The list of formatted files is only shown in verbose mode, so
+        # otherwise don't pipe and decode it
+        capture_stdout = check_only or verbose
 
-        if verbose:
-            print(f"Running: {' '.join(cmd)}")
-        # Execute the command in the specified directory
-        result = subprocess.run(cmd, cwd=str(directory), capture_output=True, text=True)
+        if parallel or jobs <= 1 or len(files) < 2:
+            returncode, stdout, stderr = _run_prettier(
+                directory, base_cmd, files, verbose, capture_stdout
+            )
+        else:
+            # Spread the files over `jobs` Prettier processes. Each shard keeps
+            # its own cache file, as concurrent runs would overwrite one shared
+            # cache, and a file's shard only depends on its path so the caches
+            # stay warm between runs.
+            shards: List[List[str]] = [[] for _ in range(jobs)]
+            for file in files:
+                shards[zlib.crc32(file.encode("utf-8")) % jobs].append(file)
+            shard_runs = []
+            for index, shard in enumerate(shards):
+                if not shard:
+                    continue
+                shard_cmd, _ = _build_prettier_cmd(
+                    directory,
+                    [],
+                    prettier_config=prettier_config,
+                    ignore_path=ignore_path,
+                    check_only=check_only,
+                    use_cache=use_cache,
+                    cache_strategy=cache_strategy,
+                    cache_name=f".prettier-cache-{index + 1}-of-{jobs}",
+                )
+                shard_runs.append((shard_cmd, shard))
 
-        if result.returncode == 0:
+            # The threads only wait on child processes, so the GIL is no issue
+            with ThreadPoolExecutor(max_workers=len(shard_runs)) as executor:
+                results = list(
+                    executor.map(
+                        lambda run: _run_prettier(
+                            directory, run[0], run[1], verbose, capture_stdout
+                        ),
+                        shard_runs,
+                    )
+                )
+            returncode = next((rc for rc, _, _ in results if rc != 0), 0)
+            stdout = "".join(out for _, out, _ in results)
+            stderr = "".join(err for _, _, err in results)
+
+        if returncode == 0:
             if check_only:
                 return True, "All files are formatted correctly."
             else:
-                return True, f"Formatting completed successfully.\n{result.stdout}"
+                if not stdout:
+                    return True, "Formatting completed successfully."
+                return True, f"Formatting completed successfully.\n{stdout}"
         else:
             if check_only:
                 # Extract file names that need formatting from stderr
                 files_needing_format = []
 
-                if result.stderr:
-                    for line in result.stderr.splitlines():
-                        if (
-                            line.startswith("[warn]")
-                            and not "Code style issues found in" in line
-                        ):
-                            # Extract the filename (remove the [warn] prefix)
-                            filename = line.replace("[warn]", "").strip()
-                            if filename:
-                                files_needing_format.append(filename)
+                if parallel:
+                    # pprettier --list-different prints one file per line
+                    files_needing_format = [
+                        line.strip() for line in stdout.splitlines() if line.strip()
+                    ]
+                elif stderr:
+                    files_needing_format = PRETTIER_WARN_RE.findall(stderr)
 
                 if files_needing_format:
                     files_msg = "\n".join(
@@ -131,69 +218,654 @@ def format_with_prettier(
                 else:
                     return False, f"Some files need formatting."
             else:
-                return False, f"Formatting failed:\n{result.stderr}"
+                return False, f"Formatting failed:\n{stderr}"
 
     except Exception as e:
         return False, f"Error: {str(e)}"
 
 
-def ensure_prettier_installed(
-    directory: Union[str, Path], verbose: bool = False
-) -> bool:
+def _chunk_files(
+    base_cmd: List[str], files: List[str], max_length: int = PRETTIER_MAX_CMD_LENGTH
+) -> Iterator[List[str]]:
     """
-    Ensure Prettier and prettier-plugin-jsdoc are installed in the specified directory.
-    If not present, attempts to install them locally.
+    Split files into chunks whose command line stays within `max_length`.
+
+    Each argument is counted with a separator and a pair of quotes. A single
+    file that doesn't fit on its own still gets a chunk of its own.
 
     Args:
-        directory: Directory to install prettier in.
-        verbose: Print verbose output.
+        base_cmd: The command the files are appended to.
+        files: Files to split.
+        max_length: Maximum length of `base_cmd` plus a chunk, in characters.
+
+    Yields:
+        Consecutive, non-empty slices of `files`.
+    """
+    base_length = sum(len(arg) + 3 for arg in base_cmd)
+    chunk: List[str] = []
+    length = base_length
+    for file in files:
+        file_length = len(file) + 3
+        if chunk and length + file_length > max_length:
+            yield chunk
+            chunk = []
+            length = base_length
+        chunk.append(file)
+        length += file_length
+    if chunk:
+        yield chunk
+
+
+def _run_prettier(
+    directory: Union[str, Path],
+    base_cmd: List[str],
+    files: List[str],
+    verbose: bool,
+    capture_stdout: bool = True,
+) -> Tuple[int, str, str]:
+    """
+    Run a Prettier command over files, in chunks that fit PRETTIER_MAX_CMD_LENGTH.
+
+    Args:
+        directory: Directory the command runs in.
+        base_cmd: The command without any files, from `_build_prettier_cmd`.
+        files: Files to process, relative to `directory`.
+        verbose: Print each command before running it.
+        capture_stdout: Collect Prettier's stdout; if False it is discarded
+            and returned as "".
 
     Returns:
-        True if prettier (and the plugin) is already installed or was successfully
-        installed; False otherwise.
+        A tuple `(returncode, stdout, stderr)`: the first non-zero exit code
+        (0 if every call succeeded) and the combined output of all calls.
     """
-    prettier_installed = False
-    jsdoc_plugin_installed = False
+    returncode = 0
+    stdout_parts = []
+    stderr_parts = []
+    for chunk in _chunk_files(base_cmd, files):
+        cmd = base_cmd + chunk
 
-    try:
-        # Check if prettier is already installed
+        if verbose:
+            print(f"Running: {' '.join(base_cmd)} <{len(chunk)} files>")
+        # Execute the command in the specified directory
         result = subprocess.run(
-            ["npx", "--no-install", "prettier", "--version"],
+            cmd,
             cwd=str(directory),
-            capture_output=True,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
+        returncode = returncode or result.returncode
+        stdout_parts.append(result.stdout or "")
+        stderr_parts.append(result.stderr)
+    return returncode, "".join(stdout_parts), "".join(stderr_parts)
 
-        if result.returncode == 0:
-            prettier_installed = True
-            if verbose:
-                print(f"Prettier version {result.stdout.strip()} is already installed.")
 
+@functools.lru_cache(maxsize=None)
+def _prettier_version(directory: str) -> Optional[str]:
+    """
+    Get the version of Prettier installed for a directory.
+
+    A local install is read from its package.json without starting Node.
+    Otherwise `prettier --version` is run, so the result is cached for the
+    run; call `_prettier_version.cache_clear()` after installing Prettier. A
+    probe already started with `_start_prettier_version_probe` is reaped
+    instead of launching a new one.
+
+    Args:
+        directory: Project directory to check.
+
+    Returns:
+        The version string, or None if Prettier can't be run.
+    """
+    proc = _pending_version_probes.pop(directory, None)
+    local_version = _local_package_version(directory, "prettier")
+    if local_version is not None:
+        if proc is not None:
+            proc.kill()
+            proc.wait()
+        return local_version
+
+    try:
+        if proc is None:
+            proc = _start_prettier_version_probe(directory)
+        stdout, _ = proc.communicate()
     except Exception:
-        # Prettier is not installed
-        pass
+        return None
+    if proc.returncode != 0:
+        return None
+    return stdout.strip()
+
+
+# Version probes launched ahead of use, keyed by directory
+_pending_version_probes: Dict[str, subprocess.Popen] = {}
+
+
+def _start_prettier_version_probe(directory: str) -> subprocess.Popen:
+    """
+    Launch `prettier --version` without waiting for it.
+
+    Args:
+        directory: Project directory to check.
+
+    Returns:
+        The running process; its stdout is the version on success.
+    """
+    return subprocess.Popen(
+        _node_bin_cmd(directory, "prettier") + ["--version"],
+        cwd=directory,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
 
+
+def _local_package_version(directory: Union[str, Path], name: str) -> Optional[str]:
+    """
+    Read the version of a package installed in a directory's node_modules.
+
+    Args:
+        directory: Project directory.
+        name: Package name, e.g. "prettier" or "@mixer/parallel-prettier".
+
+    Returns:
+        The version string, or None if the package isn't installed there.
+    """
+    package_json = Path(directory) / "node_modules" / name / "package.json"
     try:
-        # Check if prettier-plugin-jsdoc is installed by checking node_modules
-        node_modules_path = Path(directory) / "node_modules" / "prettier-plugin-jsdoc"
-        if node_modules_path.exists():
-            jsdoc_plugin_installed = True
-            if verbose:
-                print("prettier-plugin-jsdoc is already installed.")
+        version = read_json_file(str(package_json)).get("version")
     except Exception:
-        pass
+        return None
+    return version if isinstance(version, str) else None
+
+
+@functools.lru_cache(maxsize=None)
+def _default_prettier_config() -> Optional[Path]:
+    """
+    Locate the .prettierrc shipped at the root of the JSMonitor checkout.
+
+    The lookup is done once per process, so creating or deleting that file
+    while a long-lived caller is running is not picked up.
+
+    Returns:
+        The path to the default config, or None if it doesn't exist.
+    """
+    default_config = Path(__file__).parent.parent.parent / ".prettierrc"
+    return default_config if default_config.exists() else None
+
 
-    # If both are installed, we're done
-    if prettier_installed and jsdoc_plugin_installed:
+def _pprettier_available(directory: Union[str, Path]) -> bool:
+    """
+    Check whether pprettier (@mixer/parallel-prettier) can be run in a directory.
+
+    Args:
+        directory: Project directory to check.
+
+    Returns:
+        True if pprettier is installed locally or `pprettier --version`
+        succeeds, False otherwise.
+    """
+    if _local_package_version(directory, "@mixer/parallel-prettier") is not None:
         return True
+    try:
+        result = subprocess.run(
+            _node_bin_cmd(directory, "pprettier") + ["--version"],
+            cwd=str(directory),
+            capture_output=True,
+            text=True,
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+def _iter_source_files(
+    directory: Union[str, Path], file_extensions: Sequence[str]
+) -> Iterator[str]:
+    """
+    Yield the files under a directory that have one of the given extensions.
+
+    Args:
+        directory: Directory to search.
+        file_extensions: List of file extensions to include.
+
+    Yields:
+        Paths of matching files, skipping node_modules and VCS directories.
+    """
+    extensions = tuple(file_extensions)
+    stack = [str(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in IGNORED_DIR_NAMES:
+                    stack.append(entry.path)
+            elif entry.name.endswith(extensions):
+                yield entry.path
+
 
-    # Determine what needs to be installed
-    packages_to_install = []
-    if not prettier_installed:
-        packages_to_install.append("prettier")
-    if not jsdoc_plugin_installed:
-        packages_to_install.append("prettier-plugin-jsdoc")
+def _node_bin_cmd(directory: Union[str, Path], name: str) -> List[str]:
+    """
+    Get the command that runs an npm-installed executable for a directory.
+
+    The binary in node_modules/.bin is run directly when present, which skips
+    npx resolving it (and its own Node start-up) on every call. Otherwise npx
+    is used without letting it download anything.
+
+    Args:
+        directory: Project directory.
+        name: Name of the executable, e.g. "prettier".
 
+    Returns:
+        The command as an argument list.
+    """
+    bin_name = name + ".cmd" if sys.platform == "win32" else name
+    local_bin = Path(directory) / "node_modules" / ".bin" / bin_name
+    if local_bin.is_file():
+        return [str(local_bin)]
+    return ["npx", "--no-install", name]
+
+
+def _prettier_d_cmd(directory: Union[str, Path]) -> List[str]:
+    """
+    Get the command that runs the prettier_d_slim client for a directory.
+
+    Args:
+        directory: Project directory.
+
+    Returns:
+        The command as an argument list.
+    """
+    return _node_bin_cmd(directory, "prettier_d_slim")
+
+
+def _read_prettier_d_state() -> Optional[Tuple[int, str]]:
+    """
+    Read the port and token of the running prettier_d_slim server.
+
+    Returns:
+        A tuple `(port, token)`, or None if no server has written its state.
+    """
+    try:
+        with open(PRETTIER_D_STATE_FILE, "r", encoding="utf-8") as f:
+            fields = f.read().split()
+        return int(fields[0]), fields[1]
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _prettier_d_request(
+    state: Tuple[int, str], cwd: str, args: List[str], text: str
+) -> Tuple[int, bytes]:
+    """
+    Send one request to the prettier_d_slim server, as its own client does.
+
+    The request is the token followed by a JSON object with the working
+    directory, the command-line arguments and the stdin text. The server
+    answers once the connection is half-closed and closes it when done.
+
+    Args:
+        state: The server's `(port, token)` from `_read_prettier_d_state`.
+        cwd: Directory the request is resolved against.
+        args: prettier_d_slim arguments, e.g. ["--stdin", "--stdin-filepath", path].
+        text: Source sent as stdin.
+
+    Returns:
+        A tuple `(returncode, output)`: the exit code the client would have
+        returned and what it would have printed.
+
+    Raises:
+        OSError: If the server can't be reached.
+    """
+    port, token = state
+    request = f"{token} {json.dumps({'cwd': cwd, 'args': args, 'text': text})}"
+    chunks = []
+    with socket.create_connection(
+        ("127.0.0.1", port), timeout=PRETTIER_D_REQUEST_TIMEOUT
+    ) as sock:
+        sock.sendall(request.encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    reply = b"".join(chunks)
+    match = PRETTIER_D_EXIT_RE.search(reply)
+    if match:
+        return int(match.group(1)), reply[: match.start()]
+    return 0, reply
+
+
+def _connect_prettier_d(
+    directory: Union[str, Path], verbose: bool = False
+) -> Optional[Tuple[int, str]]:
+    """
+    Get the address of a prettier_d_slim server, starting one if none answers.
+
+    Args:
+        directory: Project directory whose prettier_d_slim is started.
+        verbose: Print verbose output.
+
+    Returns:
+        The server's `(port, token)`, or None if it couldn't be reached.
+    """
+
+    def reachable(state: Optional[Tuple[int, str]]) -> bool:
+        if state is None:
+            return False
+        try:
+            socket.create_connection(("127.0.0.1", state[0]), timeout=1.0).close()
+        except OSError:
+            return False
+        return True
+
+    state = _read_prettier_d_state()
+    if reachable(state):
+        return state
+
+    if verbose:
+        print("Starting prettier_d_slim server...")
+    try:
+        subprocess.run(
+            _prettier_d_cmd(directory) + ["start"],
+            cwd=str(directory),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=PRETTIER_D_START_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    # The server writes its state file once it listens
+    deadline = time.monotonic() + PRETTIER_D_START_TIMEOUT
+    while time.monotonic() < deadline:
+        state = _read_prettier_d_state()
+        if reachable(state):
+            return state
+        time.sleep(0.1)
+    return None
+
+
+def _format_with_daemon(
+    directory: Union[str, Path],
+    file_extensions: Sequence[str],
+    prettier_config: Optional[str] = None,
+    ignore_path: Optional[str] = None,
+    check_only: bool = False,
+    verbose: bool = False,
+) -> Optional[Tuple[bool, str]]:
+    """
+    Format or check files one at a time through the prettier_d_slim server.
+
+    Requests go straight to the server's socket, so no Node process starts
+    per file; the server itself is started on first use and kept for later
+    orange runs, so Prettier and its plugins are only loaded once. Line
+    endings are kept and the formatted source is written back atomically,
+    only when it differs. Files that aren't valid UTF-8 are skipped and
+    reported.
+
+    Args:
+        directory: Directory containing files to format.
+        file_extensions: List of file extensions to format.
+        prettier_config: Path to prettier config file (optional).
+        ignore_path: Path to .prettierignore file (optional). Prettier echoes
+            ignored files back unchanged, so they are never rewritten.
+        check_only: Only check if files are formatted (don't modify files).
+        verbose: Print verbose output.
+
+    Returns:
+        A tuple `(success, message)` like `format_with_prettier`, or None if
+        the server couldn't be reached before any file was processed.
+    """
+    state = _connect_prettier_d(directory, verbose)
+    if state is None:
+        return None
+
+    config_path = prettier_config
+    if not config_path:
+        default_config = _default_prettier_config()
+        if default_config:
+            config_path = str(default_config)
+
+    base_args = []
+    if config_path:
+        base_args.extend(["--config", config_path])
+    if ignore_path:
+        base_args.extend(["--ignore-path", ignore_path])
+    cwd = os.path.abspath(str(directory))
+
+    files_needing_format = []
+    skipped = []
+    errors = []
+
+    for file_path in _iter_source_files(directory, file_extensions):
+        rel_path = os.path.relpath(file_path, str(directory))
+        try:
+            with open(file_path, "rb") as f:
+                source = f.read()
+            text = source.decode("utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Skipping {rel_path}: {e}")
+            skipped.append(rel_path)
+            continue
+
+        args = base_args + ["--stdin", "--stdin-filepath", file_path]
+        try:
+            returncode, output = _prettier_d_request(state, cwd, args, text)
+        except OSError as e:
+            errors.append(f"{file_path}: {e}")
+            continue
+        if returncode != 0:
+            errors.append(f"{file_path}: {output.decode('utf-8', 'replace').strip()}")
+            continue
+
+        if output == source:
+            continue
+
+        files_needing_format.append(rel_path)
+        if not check_only:
+            write_bytes_file(file_path, output)
+            if verbose:
+                print(f"Formatted {rel_path}")
+
+    if errors:
+        return False, "Formatting failed:\n" + "\n".join(errors)
+
+    skipped_msg = ""
+    if skipped:
+        skipped_msg = (
+            f"\nSkipped {len(skipped)} file(s) that couldn't be read as UTF-8."
+        )
+
+    if check_only:
+        if files_needing_format:
+            files_msg = "\n".join(f"  - {file}" for file in files_needing_format)
+            return (
+                False,
+                f"The following files need formatting:\n{files_msg}{skipped_msg}",
+            )
+        return True, f"All files are formatted correctly.{skipped_msg}"
+
+    return (
+        True,
+        f"Formatting completed successfully ({len(files_needing_format)} files changed).{skipped_msg}",
+    )
+
+
+def _build_prettier_cmd(
+    directory: Union[str, Path],
+    files: List[str],
+    prettier_config: Optional[str] = None,
+    ignore_path: Optional[str] = None,
+    check_only: bool = False,
+    verbose: bool = False,
+    use_cache: bool = True,
+    cache_strategy: str = "metadata",
+    jobs: int = 1,
+    cache_name: str = ".prettier-cache",
+) -> Tuple[List[str], bool]:
+    """
+    Build the Prettier command line for formatting or checking `files`.
+
+    With `jobs > 1` the command runs pprettier, which spreads files over worker
+    processes. pprettier resolves configuration from the project itself and has
+    no `--config`/`--cache` options, so plain Prettier is used whenever a config
+    file has to be passed explicitly or pprettier is not installed.
+
+    Args:
+        directory: Directory the command will run in.
+        files: Files to process, relative to `directory`.
+        prettier_config: Path to prettier config file (optional).
+        ignore_path: Path to .prettierignore file (optional).
+        check_only: Only check if files are formatted (don't modify files).
+        verbose: Print verbose output.
+        use_cache: Let Prettier skip files that haven't changed since the last run
+            (formatting only; checks always read every file).
+        cache_strategy: "metadata" or "content", see `format_with_prettier`.
+        jobs: Number of parallel Prettier workers.
+        cache_name: File name of the cache in node_modules/.cache/prettier.
+
+    Returns:
+        A tuple `(cmd, parallel)` with the command as an argument list and
+        whether it runs pprettier (which reports unformatted files differently).
+    """
+    # Check for default prettier config
+    default_config = _default_prettier_config()
+    config_path = prettier_config
+    if not config_path and default_config:
+        config_path = str(default_config)
+        if verbose:
+            print(f"Using default prettier config: {default_config}")
+
+    if jobs > 1 and not config_path:
+        if _pprettier_available(directory):
+            cmd = _node_bin_cmd(directory, "pprettier") + [
+                "--concurrency",
+                str(jobs),
+            ]
+            cmd.append("--list-different" if check_only else "--write")
+            if ignore_path:
+                cmd.extend(["--ignore-path", ignore_path])
+            cmd.extend(files)
+            return cmd, True
+        elif verbose:
+            print("pprettier is not installed, running several Prettier processes.")
+
+    cmd = _node_bin_cmd(directory, "prettier")
+
+    if check_only:
+        cmd.append("--check")
+    else:
+        cmd.append("--write")
+
+    # Only formatting runs use the cache, so checks never write to the
+    # checkout (which may be read-only, e.g. in CI)
+    if use_cache and not check_only:
+        # Prettier's default cache location, spelled out so it is tied to `directory`
+        cache_location = Path(directory) / "node_modules/.cache/prettier" / cache_name
+        try:
+            cache_location.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            if verbose:
+                print(
+                    f"Can't create the Prettier cache directory, running without it: {e}"
+                )
+        else:
+            cmd.extend(
+                [
+                    "--cache",
+                    "--cache-strategy",
+                    cache_strategy,
+                    "--cache-location",
+                    str(cache_location),
+                ]
+            )
+
+    if config_path:
+        cmd.extend(["--config", config_path])
+
+    if ignore_path:
+        cmd.extend(["--ignore-path", ignore_path])
+
+    cmd.extend(files)
+    return cmd, False
+
+
+def _missing_packages(
+    directory: Union[str, Path], parallel: bool = False, daemon: bool = False
+) -> List[str]:
+    """
+    List the npm packages orange needs in a directory that aren't installed.
+
+    Args:
+        directory: Project directory.
+        parallel: Also require pprettier (@mixer/parallel-prettier).
+        daemon: Also require prettier_d_slim.
+
+    Returns:
+        The missing package names, in installation order.
+    """
+    node_modules = Path(directory) / "node_modules"
+    missing = []
+    if _prettier_version(str(directory)) is None:
+        missing.append("prettier")
+    if not (node_modules / "prettier-plugin-jsdoc").exists():
+        missing.append("prettier-plugin-jsdoc")
+    if parallel and not (node_modules / "@mixer" / "parallel-prettier").exists():
+        missing.append("@mixer/parallel-prettier")
+    if daemon and not (node_modules / "prettier_d_slim").exists():
+        missing.append("prettier_d_slim")
+    return missing
+
+
+def ensure_prettier_installed(
+    directory: Union[str, Path],
+    verbose: bool = False,
+    parallel: bool = False,
+    daemon: bool = False,
+    missing_packages: Optional[List[str]] = None,
+) -> bool:
+    """
+    Ensure Prettier and prettier-plugin-jsdoc are installed in the specified directory.
+    If not present, attempts to install them locally.
+
+    Args:
+        directory: Directory to install prettier in.
+        verbose: Print verbose output.
+        parallel: Also ensure pprettier (@mixer/parallel-prettier) is installed.
+        daemon: Also ensure prettier_d_slim is installed.
+        missing_packages: Result of `_missing_packages` if the caller already
+            checked; looked up otherwise.
+
+    Returns:
+        True if prettier (and the plugin) is already installed or was successfully
+        installed; False otherwise.
+    """
+    if missing_packages is None:
+        missing_packages = _missing_packages(directory, parallel, daemon)
+
+    if verbose:
+        if "prettier" not in missing_packages:
+            prettier_version = _prettier_version(str(directory))
+            print(f"Prettier version {prettier_version} is already installed.")
+        required = ["prettier-plugin-jsdoc"]
+        if parallel:
+            required.append("@mixer/parallel-prettier")
+        if daemon:
+            required.append("prettier_d_slim")
+        for package in required:
+            if package not in missing_packages:
+                print(f"{package} is already installed.")
+
+    # If everything is installed, we're done
+    if not missing_packages:
+        return True
+
+    packages_to_install = missing_packages
     print(f"Installing missing packages: {', '.join(packages_to_install)}...")
 
     try:
@@ -202,15 +874,28 @@ def ensure_prettier_installed(
         if not package_json.exists():
             if verbose:
                 print("package.json not found, creating it...")
-            subprocess.run(
-                ["npm", "init", "-y"],
-                cwd=str(directory),
-                capture_output=not verbose,
-                text=True,
+            # Written directly rather than through `npm init -y`, which would
+            # cost an extra Node start-up; like npm, name it after the directory
+            name = re.sub(r"[^a-z0-9._-]+", "-", Path(directory).resolve().name.lower())
+            write_json_file(
+                str(package_json),
+                {
+                    "name": name.strip("._-") or "project",
+                    "version": "1.0.0",
+                    "private": True,
+                },
             )
 
-        # Install packages as dev dependencies
-        install_cmd = ["npm", "install", "--save-dev"] + packages_to_install
+        # Install packages as dev dependencies, skipping the audit and funding
+        # requests and revalidation of already cached package metadata
+        install_cmd = [
+            "npm",
+            "install",
+            "--save-dev",
+            "--no-audit",
+            "--no-fund",
+            "--prefer-offline",
+        ] + packages_to_install
         if verbose:
             print(f"Running: {' '.join(install_cmd)}")
 
@@ -220,6 +905,8 @@ def ensure_prettier_installed(
 
         if result.returncode == 0:
             print(f"Packages installed successfully: {', '.join(packages_to_install)}")
+            # The cached probe result predates the install
+            _prettier_version.cache_clear()
             return True
         else:
             print(f"Failed to install packages: {result.stderr}")
@@ -230,6 +917,24 @@ def ensure_prettier_installed(
         return False
 
 
+def _parse_extensions(value: str) -> Tuple[str, ...]:
+    """
+    Parse the comma-separated `--extensions` argument.
+
+    Args:
+        value: The raw argument, e.g. "js, .ts,tsx".
+
+    Returns:
+        The extensions with a leading dot as a tuple, so they can be passed
+        straight to `str.endswith`, e.g. (".js", ".ts", ".tsx").
+    """
+    return tuple(
+        ext if ext.startswith(".") else f".{ext}"
+        for ext in (part.strip() for part in value.split(","))
+        if ext
+    )
+
+
 def main():
     """
     Main function to handle command line arguments and execute formatting.
@@ -260,9 +965,9 @@ def main():
 
     parser.add_argument(
         "--extensions",
-        type=str,
-        default=".js,.jsx,.ts,.tsx,.vue,.css,.html,.json",
-        help="Comma-separated list of file extensions to format (default: .js,.jsx,.ts,.tsx,.vue,.css,.html,.json)",
+        type=_parse_extensions,
+        default=",".join(DEFAULT_EXTENSIONS),
+        help=f"Comma-separated list of file extensions to format (default: {','.join(DEFAULT_EXTENSIONS)})",
     )
 
     parser.add_argument("--config", type=str, help="Path to Prettier config file")
@@ -275,6 +980,32 @@ def main():
         help="Force installation of Prettier and prettier-plugin-jsdoc (packages are installed automatically if needed)",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable Prettier's cache and re-format every file (checks never use the cache)",
+    )
+
+    parser.add_argument(
+        "--cache-strategy",
+        choices=["metadata", "content"],
+        default="metadata",
+        help="How the cache detects unchanged files: by modification time and size, or by content hash (use 'content' in CI, where checkouts reset modification times; default: metadata)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of parallel Prettier workers; values above 1 use pprettier (@mixer/parallel-prettier), installing it if needed, or split the files over that many Prettier processes when a config file is used (default: 1)",
+    )
+
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Format through a long-lived prettier_d_slim server, installing it if needed",
+    )
+
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Print verbose output"
     )
@@ -284,52 +1015,47 @@ def main():
     # Convert directory to Path
     directory = Path(args.directory).resolve()
 
-    # Parse extensions
-    extensions = [ext.strip() for ext in args.extensions.split(",")]
-    extensions = [ext if ext.startswith(".") else f".{ext}" for ext in extensions]
+    # Without a local install Prettier has to be asked for its version, and
+    # Node is slow to start, so let that probe run while the other checks happen
+    if _local_package_version(directory, "prettier") is None:
+        try:
+            _pending_version_probes[str(directory)] = _start_prettier_version_probe(
+                str(directory)
+            )
+        except Exception:
+            pass
+
+    # Already normalised by _parse_extensions
+    extensions = args.extensions
 
     if args.verbose:
         print(f"Processing directory: {directory}")
         print(f"File extensions: {extensions}")
-    # Check if prettier and prettier-plugin-jsdoc are installed, install them if missing or if explicitly requested
-    prettier_installed = True
-    jsdoc_plugin_installed = True
-
-    try:
-        # Try to check prettier version first
-        result = subprocess.run(
-            ["npx", "--no-install", "prettier", "--version"],
-            cwd=str(directory),
-            capture_output=True,
-            text=True,
+    # pprettier is only needed when formatting with several workers, and can only
+    # be used when no config file has to be passed explicitly
+    parallel = args.jobs > 1
+    if parallel and (args.config or _default_prettier_config()):
+        print(
+            f"pprettier can't take a --config file; splitting the files over {args.jobs} Prettier processes instead."
         )
+        parallel = False
 
-        if result.returncode != 0:
-            prettier_installed = False
-    except Exception:
-        prettier_installed = False
-
-    try:
-        # Check if prettier-plugin-jsdoc is installed
-        node_modules_path = directory / "node_modules" / "prettier-plugin-jsdoc"
-        if not node_modules_path.exists():
-            jsdoc_plugin_installed = False
-    except Exception:
-        jsdoc_plugin_installed = False
-
-    # Install packages if they're not installed or if explicitly requested
-    if not prettier_installed or not jsdoc_plugin_installed or args.install:
+    # Check which packages are missing (this collects the version probe
+    # started above); install them if missing or if explicitly requested
+    missing_packages = _missing_packages(directory, parallel, args.daemon)
+    if missing_packages or args.install:
         if args.install:
             print("Installation explicitly requested.")
         else:
-            missing_packages = []
-            if not prettier_installed:
-                missing_packages.append("prettier")
-            if not jsdoc_plugin_installed:
-                missing_packages.append("prettier-plugin-jsdoc")
             print(f"Missing packages: {', '.join(missing_packages)}")
 
-        if not ensure_prettier_installed(directory, args.verbose):
+        if not ensure_prettier_installed(
+            directory,
+            args.verbose,
+            parallel,
+            daemon=args.daemon,
+            missing_packages=missing_packages,
+        ):
             sys.exit(1)
     # Format files with Prettier
     success, message = format_with_prettier(
@@ -340,6 +1066,10 @@ def main():
         check_only=args.check,
         verbose=args.verbose,
         auto_install=True,  # Always attempt to auto-install if needed
+        use_cache=not args.no_cache,
+        cache_strategy=args.cache_strategy,
+        jobs=args.jobs,
+        daemon=args.daemon,
     )
 
     print(message)
@@ -3,19 +3,198 @@
 Utility functions shared between npm tools.
 """
 
+import atexit
+import functools
+import http.client
 import json
 import os
+import shutil
+import threading
+import time
 import urllib.error
 import urllib.request
-from typing import Dict, List, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
 
-def get_latest_package_version(package_name: str) -> str:
+REGISTRY_HOST = "registry.npmjs.org"
+
+# npm's abbreviated metadata format ("corgi"): carries dist-tags and versions but
+# drops readmes and per-version manifests, so it is a fraction of the full document
+ABBREVIATED_METADATA = "application/vnd.npm.install-v1+json"
+
+# Latest versions are cached on disk so back-to-back runs don't hit the registry again
+VERSION_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "jsmonitor",
+    "npm-versions.json",
+)
+# Stale entries are revalidated with the stored ETag, which is cheap, so the
+# time they are trusted without asking the registry can stay short
+VERSION_CACHE_TTL = 60 * 60  # seconds
+
+# Concurrent registry lookups made by get_latest_package_versions
+REGISTRY_LOOKUP_WORKERS = 16
+
+# get_installed_packages lists scope directories in threads only when there
+# are more of them than this; a pool costs more than a few directory reads
+SCOPE_SCAN_THREAD_THRESHOLD = 4
+
+# One keep-alive connection per thread so TLS handshakes are reused across lookups
+_registry_connections = threading.local()
+
+
+def _registry_get(
+    package_name: str, etag: Optional[str] = None, dist_tag: Optional[str] = None
+) -> Tuple[int, bytes, Optional[str]]:
+    """
+    Fetch registry metadata (the abbreviated document by default) for a package.
+
+    Args:
+        package_name: The name of the npm package to query.
+        etag: ETag of a previously fetched copy; if the document is unchanged
+            the registry answers 304 with an empty body.
+        dist_tag: Fetch only the manifest of the version with this dist-tag
+            (e.g. "latest") instead of the package document.
+
+    Returns:
+        A tuple `(status, body, etag)` with the HTTP status code, raw response
+        body and the response's ETag header (None if absent).
+    """
+    if dist_tag:
+        # A single version's manifest is a few KB, whatever the package's history
+        path = f"/{package_name}/{dist_tag}"
+        headers = {"Accept": "application/json"}
+    else:
+        path = f"/{package_name}"
+        headers = {"Accept": ABBREVIATED_METADATA}
+    if etag:
+        headers["If-None-Match"] = etag
+
+    # http.client does not honour proxy settings, so defer to urllib when one is configured
+    if "https" in urllib.request.getproxies():
+        request = urllib.request.Request(
+            f"https://{REGISTRY_HOST}{path}", headers=headers
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, response.read(), response.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            return e.code, b"", e.headers.get("ETag")
+
+    for attempt in range(2):
+        conn = getattr(_registry_connections, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(REGISTRY_HOST, timeout=30)
+            _registry_connections.conn = conn
+
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.read(), response.getheader("ETag")
+        except (http.client.HTTPException, OSError):
+            # Drop the connection; retry once in case the server closed an idle keep-alive
+            conn.close()
+            _registry_connections.conn = None
+            if attempt:
+                raise
+
+
+# On-disk version cache, loaded lazily: {name: {"v": version, "t": epoch_seconds, "e": etag}}
+_version_cache: Dict[str, Dict] = {}
+_version_cache_loaded = False
+_version_cache_dirty = False
+_version_cache_lock = threading.Lock()
+
+
+def _load_version_cache() -> None:
+    """
+    Load `VERSION_CACHE_PATH` into `_version_cache`; call with the lock held.
+
+    A missing or unreadable cache file leaves the cache empty.
+    """
+    global _version_cache_loaded
+    _version_cache_loaded = True
+    try:
+        with open(VERSION_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            _version_cache.update(data)
+    except (OSError, ValueError):
+        pass
+
+
+def _save_version_cache() -> None:
+    """
+    Write `_version_cache` to `VERSION_CACHE_PATH`; call with the lock held.
+
+    Entries written by concurrent runs since the cache was loaded are merged in
+    first, keeping the newer of two entries for the same package. Write failures
+    are ignored so a read-only cache directory never breaks a lookup.
+    """
+    try:
+        with open(VERSION_CACHE_PATH, "r", encoding="utf-8") as f:
+            on_disk = json.load(f)
+    except (OSError, ValueError):
+        on_disk = None
+    if isinstance(on_disk, dict):
+        for name, disk_entry in on_disk.items():
+            entry = _version_cache.get(name)
+            if not isinstance(disk_entry, dict):
+                continue
+            if not isinstance(entry, dict) or entry.get("t", 0) < disk_entry.get(
+                "t", 0
+            ):
+                _version_cache[name] = disk_entry
+
+    tmp_path = f"{VERSION_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(VERSION_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_version_cache, f)
+        # Atomic rename so concurrent runs never see a half-written file
+        os.replace(tmp_path, VERSION_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _flush_version_cache() -> None:
+    """
+    Write the version cache to disk if any lookup changed it since the last flush.
+
+    Runs at the end of `get_latest_package_versions` and at interpreter exit, so
+    a batch of lookups costs a single write.
+    """
+    global _version_cache_dirty
+    with _version_cache_lock:
+        if not _version_cache_dirty:
+            return
+        _save_version_cache()
+        _version_cache_dirty = False
+
+
+atexit.register(_flush_version_cache)
+
+
+@functools.lru_cache(maxsize=4096)
+def get_latest_package_version(
+    package_name: str, cache_ttl_seconds: float = VERSION_CACHE_TTL
+) -> str:
     """
     Get the latest version of a package from npm registry.
 
+    Versions are cached in `VERSION_CACHE_PATH` together with the registry's
+    ETag. Entries younger than `cache_ttl_seconds` are used without a request;
+    older ones are revalidated with a conditional GET, so an unchanged package
+    costs a body-less 304 response.
+
     Args:
         package_name: The name of the npm package to query.
+        cache_ttl_seconds: Maximum age of a cached version that is used as-is.
 
     Returns:
         version: The latest version string of the package.
@@ -23,27 +202,81 @@ def get_latest_package_version(package_name: str) -> str:
     Raises:
         Exception: If the package cannot be found or there's an error connecting to the npm registry.
     """
-    url = f"https://registry.npmjs.org/{package_name}"
+    global _version_cache_dirty
+    with _version_cache_lock:
+        if not _version_cache_loaded:
+            _load_version_cache()
+        entry = _version_cache.get(package_name)
+    if not isinstance(entry, dict) or "v" not in entry:
+        entry = None
+
+    if entry is not None and time.time() - entry.get("t", 0) < cache_ttl_seconds:
+        return entry["v"]
 
+    cached_etag = entry.get("e") if entry is not None else None
     try:
-        with urllib.request.urlopen(url) as response:
-            if response.status == 200:
-                package_data = json.loads(response.read().decode("utf-8"))
-                version = package_data["dist-tags"]["latest"]
-                return version
-            else:
-                raise Exception(
-                    f"Failed to get package info. Status code: {response.status}"
-                )
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            raise Exception(f"Package {package_name} not found")
-        else:
-            raise Exception(f"HTTP error for {package_name}: {e}")
+        status, body, etag = _registry_get(package_name, cached_etag, "latest")
+        if status == 304 and entry is not None:
+            version = entry["v"]
+            etag = etag or cached_etag
+        elif status == 200:
+            package_data = json.loads(body.decode("utf-8"))
+            version = package_data["version"]
+        elif status != 404:
+            raise Exception(f"Failed to get package info. Status code: {status}")
     except Exception as e:
         raise Exception(f"Request error for {package_name}: {str(e)}")
+    if status == 404:
+        raise Exception(f"Package {package_name} not found")
+
+    with _version_cache_lock:
+        new_entry = {"v": version, "t": time.time()}
+        if etag:
+            new_entry["e"] = etag
+        _version_cache[package_name] = new_entry
+        _version_cache_dirty = True
+    return version
+
+
+def get_latest_package_versions(
+    package_names: List[str], errors: Optional[Dict[str, Exception]] = None
+) -> Dict[str, str]:
+    """
+    Get the latest versions of several packages from npm registry.
+
+    Lookups run concurrently and go through `get_latest_package_version`, so
+    they share its keep-alive connections and caches.
+
+    Args:
+        package_names: The names of the npm packages to query.
+        errors: Optional dict collecting the exception for every package whose
+            lookup failed.
+
+    Returns:
+        versions: The latest version of every package that could be looked up,
+            in the order of `package_names`.
+    """
+    versions: Dict[str, str] = {}
+    if not package_names:
+        return versions
 
+    workers = min(REGISTRY_LOOKUP_WORKERS, len(package_names))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (package_name, executor.submit(get_latest_package_version, package_name))
+            for package_name in package_names
+        ]
+        for package_name, future in futures:
+            try:
+                versions[package_name] = future.result()
+            except Exception as e:
+                if errors is not None:
+                    errors[package_name] = e
+    _flush_version_cache()
+    return versions
 
+
+@functools.lru_cache(maxsize=4096)
 def check_types_package_exists(package_name: str) -> bool:
     """
     Check if a @types package exists for a given package name.
@@ -59,57 +292,158 @@ def check_types_package_exists(package_name: str) -> bool:
         return False
 
     types_package = f"@types/{package_name}"
-    url = f"https://registry.npmjs.org/{types_package}"
 
     try:
-        with urllib.request.urlopen(url) as response:
-            return response.status == 200
-    except urllib.error.HTTPError:
-        return False
+        status, _, _ = _registry_get(types_package)
+        return status == 200
     except Exception:
         return False
 
 
-def get_installed_packages(directory_path: str) -> Set[str]:
+def read_json_file(path: str) -> Any:
     """
-    Get a set of packages that are currently installed in node_modules.
+    Read and parse a JSON file, using orjson when it is installed.
 
     Args:
-        directory_path: Path to the project directory.
+        path: Path to the JSON file.
+
+    Returns:
+        The parsed JSON document.
+
+    Raises:
+        ValueError: If the file does not contain valid JSON.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def write_json_file(path: str, data: Any) -> None:
+    """
+    Atomically write `data` as 2-space indented JSON with a trailing newline.
+
+    Non-ASCII characters are written as-is (like npm does) with either backend.
+
+    Args:
+        path: Path of the file to write.
+        data: The JSON-serialisable document.
+    """
+    if orjson is not None:
+        blob = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    else:
+        blob = json.dumps(data, indent=2, ensure_ascii=False)
+
+    # Write the whole document in one call to a temporary file and swap it in,
+    # so an interrupted run never leaves a half-written file behind
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(blob + "\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_bytes_file(path: str, data: bytes) -> None:
+    """
+    Atomically replace the contents of a file with `data`.
+
+    Args:
+        path: Path of the file to write.
+        data: The new contents, written as-is.
+    """
+    # Same temporary-file swap as write_json_file, without any newline
+    # translation so CRLF sources stay CRLF
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        if os.path.exists(path):
+            # Keep the permissions of the file being replaced
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _scan_scope(scope_path: str) -> List[str]:
+    """
+    List the packages installed in a scope directory such as node_modules/@types.
+
+    Args:
+        scope_path: Path to the scope directory.
 
     Returns:
-        installed_packages: A set of installed package names.
+        Package names qualified with the scope, e.g. "@types/node".
+    """
+    scope_name = os.path.basename(scope_path)
+    with os.scandir(scope_path) as it:
+        return [f"{scope_name}/{entry.name}" for entry in it if entry.is_dir()]
+
+
+def iter_installed_packages(directory_path: str) -> Iterator[str]:
+    """
+    Yield the names of the packages currently installed in node_modules.
+
+    Names are produced while node_modules is being read, so callers that stop
+    early or only count never hold the whole listing.
+
+    Args:
+        directory_path: Path to the project directory.
+
+    Yields:
+        Installed package names, scoped ones as e.g. "@types/node".
     """
     node_modules_path = os.path.join(directory_path, "node_modules")
 
     # If node_modules doesn't exist, no packages are installed
     if not os.path.isdir(node_modules_path):
-        return set()
-
-    installed_packages = set()
-
-    # Check for packages in node_modules
-    for item in os.listdir(node_modules_path):
-        # Skip hidden directories and scoped packages directory
-        if item.startswith(".") or item.startswith("@"):
-            continue
-
-        package_path = os.path.join(node_modules_path, item)
-        if os.path.isdir(package_path):
-            installed_packages.add(item)
-
-    # Handle scoped packages (e.g., @types/node)
-    scoped_packages_path = [
-        os.path.join(node_modules_path, item)
-        for item in os.listdir(node_modules_path)
-        if item.startswith("@") and os.path.isdir(os.path.join(node_modules_path, item))
-    ]
-
-    for scope_path in scoped_packages_path:
-        scope_name = os.path.basename(scope_path)
-        for package in os.listdir(scope_path):
-            package_path = os.path.join(scope_path, package)
-            if os.path.isdir(package_path):
-                installed_packages.add(f"{scope_name}/{package}")
-
-    return installed_packages
+        return
+
+    scoped_paths = []
+
+    # One pass over node_modules; DirEntry carries the file type from the
+    # listing, so only symlinked packages (npm link, pnpm) need an extra stat
+    with os.scandir(node_modules_path) as it:
+        for entry in it:
+            # Skip hidden directories such as .bin and .cache
+            if entry.name.startswith("."):
+                continue
+            if not entry.is_dir():
+                continue
+            if entry.name.startswith("@"):
+                # Scope directory (e.g. @types), whose packages are listed below
+                scoped_paths.append(entry.path)
+            else:
+                yield entry.name
+
+    # Handle scoped packages (e.g., @types/node). Directory reads release the
+    # GIL, so many scopes are listed concurrently
+    if len(scoped_paths) > SCOPE_SCAN_THREAD_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(32, len(scoped_paths))) as executor:
+            for scoped_packages in executor.map(_scan_scope, scoped_paths):
+                yield from scoped_packages
+    else:
+        for scope_path in scoped_paths:
+            yield from _scan_scope(scope_path)
+
+
+def get_installed_packages(directory_path: str) -> FrozenSet[str]:
+    """
+    Get a set of packages that are currently installed in node_modules.
+
+    Args:
+        directory_path: Path to the project directory.
+
+    Returns:
+        installed_packages: A frozenset of installed package names, meant to be
+            computed once and shared for membership tests.
+    """
+    return frozenset(iter_installed_packages(directory_path))
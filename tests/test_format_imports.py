@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from python.format_imports import resolve_relative_path, split_dir_parts
+
+ROOT = os.path.abspath(os.sep)
+
+
+@pytest.mark.parametrize(
+    "directory",
+    [
+        ROOT,
+        os.path.join(ROOT, "abs"),
+        os.path.join(ROOT, "abs", "project", "src"),
+    ],
+)
+@pytest.mark.parametrize(
+    "relative_path",
+    [
+        ".",
+        "./a",
+        "./a/",
+        "./a/./b",
+        "../b",
+        "../../c/d",
+        "../../../../../e",
+        "./a/../b",
+        "./a//b",
+        "..",
+    ],
+)
+def test_resolve_relative_path_matches_normpath(directory, relative_path):
+    expected = os.path.normpath(os.path.join(directory, relative_path))
+    assert resolve_relative_path(split_dir_parts(directory), relative_path) == expected
+
+
+def test_split_dir_parts():
+    directory = os.path.join(ROOT, "abs", "project", "src")
+    assert split_dir_parts(directory)[1:] == ("abs", "project", "src")
@@ -0,0 +1,84 @@
+import re
+
+import pytest
+
+from python.image_import_check import (
+    COMBINED_IMPORT_RE,
+    IMPORT_PATTERNS,
+    MMAP_THRESHOLD,
+    _scan_asset_imports,
+    check_css_imports,
+)
+
+SOURCE = """\
+import './styles.css';
+import logo from "../assets/logo.png";
+export { default as icon } from './icon.svg';
+const banner = require('./banner.jpg');
+const lazy = import("./lazy.webp");
+import React from 'react';
+const data = require('./data.json');
+  import   "./indented.gif"  ;
+"""
+
+
+def _first_match_per_line(text):
+    """The per-line scan the combined regex replaces: first pattern wins."""
+    found = []
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        for pattern in IMPORT_PATTERNS:
+            m = pattern.search(line)
+            if m:
+                found.append((lineno, m.group("path")))
+                break
+    return found
+
+
+def test_combined_regex_matches_per_line_patterns(tmp_path):
+    src = tmp_path / "index.ts"
+    src.write_text(SOURCE)
+    assert _scan_asset_imports(src) == _first_match_per_line(SOURCE)
+
+
+def test_combined_regex_on_memory_mapped_file(tmp_path):
+    text = "// padding\n" * (MMAP_THRESHOLD // 10) + SOURCE
+    src = tmp_path / "big.ts"
+    src.write_text(text)
+    assert _scan_asset_imports(src) == _first_match_per_line(text)
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        (
+            "const a = require('./a.png'); const b = require('./b.css');",
+            ["./a.png", "./b.css"],
+        ),
+        (
+            "const a = import('./a.svg'), b = require('./b.gif');",
+            ["./a.svg", "./b.gif"],
+        ),
+        ("import('./a.png'); import('./b.png')", ["./a.png", "./b.png"]),
+    ],
+)
+def test_several_imports_on_one_line(tmp_path, line, expected):
+    src = tmp_path / "index.js"
+    src.write_text(f"// header\n{line}\n")
+    assert _scan_asset_imports(src) == [(2, path) for path in expected]
+    # The per-line scan stopped at the first import; the regex finds them all
+    assert [
+        m.group(m.lastgroup).decode()
+        for m in COMBINED_IMPORT_RE.finditer(line.encode())
+    ] == expected
+
+
+def test_ignore_regex_only_matches_file_paths(tmp_path):
+    (tmp_path / "test").mkdir()
+    (tmp_path / "test" / "app.ts").write_text("import './missing.css';\n")
+
+    # The regex matches the directory, but not the file inside it
+    missing, messages = check_css_imports(
+        tmp_path, ignore_regexes=[re.compile(r"/test$")]
+    )
+    assert missing == 1
+    assert "missing.css" in "".join(messages)
@@ -0,0 +1,137 @@
+import subprocess
+
+import pytest
+
+from python import npm_check_installs
+from python.npm_check_installs import (
+    ALL_IMPORTS_RE,
+    DYNAMIC_IMPORT_RE,
+    ES6_IMPORT_PATTERNS,
+    REQUIRE_RE,
+    _scan_imports,
+    extract_imports,
+    install_package,
+    install_packages,
+)
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("import React from 'react';", {"react"}),
+        ("import 'reflect-metadata';", {"reflect-metadata"}),
+        (
+            "import 'reflect-metadata'; import React from 'react';",
+            {"reflect-metadata", "react"},
+        ),
+        ("import 'a'; import b from 'c'", {"a", "c"}),
+        ("import a from 'x'; import b from 'y';", {"x", "y"}),
+        ("export { a } from 'x'; export * from 'y';", {"x", "y"}),
+        ("const a = require('a'); const b = require('b');", {"a", "b"}),
+        (
+            "const x = await import('foo'); const y = require('bar');",
+            {"foo", "bar"},
+        ),
+        ("import { a } from 'lodash/fp';", {"lodash"}),
+        ("import x from '@babel/core/lib';", {"@babel/core"}),
+        ("import x from './local'; import y from '../up';", set()),
+        ("import {\n  a,\n} from 'multi';\nimport 'side';", {"multi", "side"}),
+        ("export {\n  a,\n} from 'multi'", {"multi"}),
+        ("const {\n  a,\n} = require('multi');", {"multi"}),
+        (
+            "import x from './local'\nimport 'side'\nimport y from 'pkg'\n",
+            {"side", "pkg"},
+        ),
+        ("const a = 1\nimport b from 'pkg'", {"pkg"}),
+    ],
+)
+def test_extract_imports(tmp_path, source, expected):
+    path = tmp_path / "file.ts"
+    path.write_text(source)
+    assert extract_imports(str(path)) == expected
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        b"import 'reflect-metadata'; import React from 'react';",
+        b"import a from 'x';\nconst b = require('y');\nexport * from 'z';",
+        b"const m = import('dyn');\nimport 'side'; export { q } from 'q'",
+        b"import def, { named } from 'pkg/sub';\nlet r = require(\"r\")",
+        b"import {\n  a,\n} from 'multi'\nimport 'side'\nconst {\n  b,\n} = require('req')",
+    ],
+)
+def test_fused_regex_finds_every_separate_match(source):
+    separate = {
+        m.group(1)
+        for pattern in ES6_IMPORT_PATTERNS + [REQUIRE_RE, DYNAMIC_IMPORT_RE]
+        for m in pattern.finditer(source)
+    }
+    fused = {m.group(m.lastindex) for m in ALL_IMPORTS_RE.finditer(source)}
+    assert fused == separate
+
+
+@pytest.mark.parametrize("verbose", [False, True])
+def test_install_package_prints_npm_warnings(tmp_path, monkeypatch, capsys, verbose):
+    def fake_run(cmd, **kwargs):
+        return subprocess.CompletedProcess(
+            cmd, 0, stdout="added 1 package", stderr="npm WARN deprecated left-pad"
+        )
+
+    monkeypatch.setattr(
+        npm_check_installs, "get_latest_package_version", lambda name: "1.0.0"
+    )
+    monkeypatch.setattr(npm_check_installs.subprocess, "run", fake_run)
+
+    assert install_package("left-pad", str(tmp_path), verbose=verbose) == (
+        True,
+        "1.0.0",
+    )
+    out = capsys.readouterr().out
+    assert "npm WARN deprecated left-pad" in out
+    assert ("added 1 package" in out) == verbose
+
+
+def test_failed_batch_install_is_rolled_back(tmp_path, monkeypatch, capsys):
+    original = b'{\r\n  "name": "app"\r\n}\r\n'
+    (tmp_path / "package.json").write_bytes(original)
+    manifests = []
+
+    def fake_run(cmd, **kwargs):
+        if cmd == ["npm", "install"]:
+            raise subprocess.CalledProcessError(1, cmd, stderr="ERESOLVE")
+        manifests.append((tmp_path / "package.json").read_bytes())
+        if cmd[-1].startswith("bad@"):
+            raise subprocess.CalledProcessError(1, cmd, stderr="E404")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(
+        npm_check_installs,
+        "get_latest_package_versions",
+        lambda names, errors=None: {name: "1.0.0" for name in names},
+    )
+    monkeypatch.setattr(
+        npm_check_installs, "get_latest_package_version", lambda name: "1.0.0"
+    )
+    monkeypatch.setattr(npm_check_installs.subprocess, "run", fake_run)
+
+    installed = install_packages(["good", "bad"], str(tmp_path))
+
+    assert installed == {"good": "1.0.0"}
+    # The fallback starts from the untouched manifest
+    assert manifests[0] == original
+    out = capsys.readouterr().out
+    assert out.count("Updated package.json") == 1
+    assert "Updated package.json with 1 new dependencies" in out
+
+
+def test_scan_imports_returns_aliases_and_errors(tmp_path, capsys):
+    path = tmp_path / "index.ts"
+    path.write_text("import a from '@/components/a';\nimport b from 'lodash';\n")
+
+    assert _scan_imports(str(path)) == ({"lodash"}, ["@/components/a"], None)
+    imports, aliases, error = _scan_imports(str(tmp_path / "missing.ts"))
+    assert (imports, aliases) == (set(), [])
+    assert error.startswith("Error reading")
+    # Workers must not print; the parent reports both
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,139 @@
+import json
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+from python import orange
+from python.orange import _build_prettier_cmd, _chunk_files, _parse_extensions
+
+
+def _cmd_length(cmd):
+    return sum(len(arg) + 3 for arg in cmd)
+
+
+def test_chunk_files_stays_within_limit():
+    base_cmd = ["prettier.cmd", "--write", "--config", "C:\\project\\.prettierrc"]
+    files = [f"src\\components\\feature{i}\\Component{i}.tsx" for i in range(600)]
+
+    chunks = list(_chunk_files(base_cmd, files, max_length=7000))
+
+    assert [file for chunk in chunks for file in chunk] == files
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert _cmd_length(base_cmd + chunk) <= 7000
+
+
+def test_chunk_files_keeps_oversized_file():
+    chunks = list(_chunk_files(["prettier"], ["a" * 50, "b"], max_length=20))
+    assert chunks == [["a" * 50], ["b"]]
+
+
+def test_chunk_files_empty():
+    assert list(_chunk_files(["prettier"], [])) == []
+
+
+def test_check_does_not_use_cache(tmp_path):
+    cmd, _ = _build_prettier_cmd(tmp_path, ["a.js"], check_only=True)
+    assert "--check" in cmd
+    assert "--cache" not in cmd
+    assert not (tmp_path / "node_modules").exists()
+
+
+def test_write_uses_cache(tmp_path):
+    cmd, _ = _build_prettier_cmd(tmp_path, ["a.js"], cache_strategy="content")
+    assert "--cache" in cmd
+    assert cmd[cmd.index("--cache-strategy") + 1] == "content"
+    assert (tmp_path / "node_modules" / ".cache" / "prettier").is_dir()
+
+
+def test_write_without_cache_dir(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(Path, "mkdir", fail)
+    cmd, _ = _build_prettier_cmd(tmp_path, ["a.js"])
+    assert "--write" in cmd
+    assert "--cache" not in cmd
+
+
+def test_parse_extensions_returns_tuple():
+    assert _parse_extensions("js, .ts,tsx,") == (".js", ".ts", ".tsx")
+
+
+@pytest.fixture
+def fake_daemon(tmp_path, monkeypatch):
+    """Serve prettier_d_slim's socket protocol, appending "// fmt" to sources."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    requests = []
+
+    def serve():
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            with conn:
+                data = b""
+                while True:
+                    chunk = conn.recv(65536)
+                    if not chunk:
+                        break
+                    data += chunk
+                if not data:
+                    continue
+                token, payload = data.decode("utf-8").split(" ", 1)
+                request = json.loads(payload)
+                requests.append((token, request))
+                if "bad" in request["args"][-1]:
+                    conn.sendall(b"SyntaxError: Unexpected token\n# exit 1")
+                elif request["text"].endswith("// fmt"):
+                    conn.sendall(request["text"].encode("utf-8"))
+                else:
+                    conn.sendall((request["text"] + "// fmt").encode("utf-8"))
+
+    threading.Thread(target=serve, daemon=True).start()
+    state_file = tmp_path / "state"
+    state_file.write_text(f"{server.getsockname()[1]} secret")
+    monkeypatch.setattr(orange, "PRETTIER_D_STATE_FILE", str(state_file))
+    yield requests
+    server.close()
+
+
+def test_daemon_formats_over_socket(tmp_path, fake_daemon):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.ts").write_bytes(b"const a = 1;\r\n")
+    (project / "b.ts").write_bytes(b"const b = 1;// fmt")
+
+    success, message = orange._format_with_daemon(project, [".ts"])
+
+    assert success, message
+    assert "1 files changed" in message
+    assert (project / "a.ts").read_bytes() == b"const a = 1;\r\n// fmt"
+    assert all(token == "secret" for token, _ in fake_daemon)
+    assert fake_daemon[0][1]["cwd"] == str(project)
+
+
+def test_daemon_check_reports_failures(tmp_path, fake_daemon):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.ts").write_bytes(b"const a = 1;")
+    (project / "bad.ts").write_bytes(b"const = ;")
+
+    success, message = orange._format_with_daemon(project, [".ts"], check_only=True)
+
+    assert not success
+    assert "SyntaxError: Unexpected token" in message
+    assert (project / "a.ts").read_bytes() == b"const a = 1;"
+
+
+def test_daemon_unreachable(tmp_path, monkeypatch):
+    monkeypatch.setattr(orange, "PRETTIER_D_STATE_FILE", str(tmp_path / "missing"))
+    monkeypatch.setattr(orange, "PRETTIER_D_START_TIMEOUT", 0.2)
+    monkeypatch.setattr(orange.subprocess, "run", lambda *args, **kwargs: None)
+
+    assert orange._format_with_daemon(tmp_path, [".ts"]) is None
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from python import utils
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """Point the version cache at `tmp_path` and stub out the npm registry."""
+    calls = []
+
+    def fake_get(package_name, etag=None, dist_tag=None):
+        calls.append(package_name)
+        if package_name == "missing":
+            return 404, b"", None
+        return 200, json.dumps({"version": "1.0.0"}).encode("utf-8"), None
+
+    cache_path = tmp_path / "versions.json"
+    monkeypatch.setattr(utils, "VERSION_CACHE_PATH", str(cache_path))
+    monkeypatch.setattr(utils, "_registry_get", fake_get)
+    monkeypatch.setattr(utils, "_version_cache", {})
+    monkeypatch.setattr(utils, "_version_cache_loaded", False)
+    monkeypatch.setattr(utils, "_version_cache_dirty", False)
+    utils.get_latest_package_version.cache_clear()
+    yield cache_path, calls
+    utils.get_latest_package_version.cache_clear()
+
+
+def test_versions_are_written_once_per_batch(registry, monkeypatch):
+    cache_path, calls = registry
+    saves = []
+    save = utils._save_version_cache
+    monkeypatch.setattr(utils, "_save_version_cache", lambda: saves.append(save()))
+
+    versions = utils.get_latest_package_versions(["a", "b", "c"])
+
+    assert versions == {"a": "1.0.0", "b": "1.0.0", "c": "1.0.0"}
+    assert len(saves) == 1
+    assert set(json.loads(cache_path.read_text())) == {"a", "b", "c"}
+
+
+def test_flush_merges_entries_written_by_other_runs(registry):
+    cache_path, calls = registry
+    utils.get_latest_package_version("a")
+    cache_path.write_text(json.dumps({"other": {"v": "2.0.0", "t": 1}}))
+
+    utils._flush_version_cache()
+
+    assert set(json.loads(cache_path.read_text())) == {"a", "other"}
+
+
+def test_missing_package_message(registry):
+    errors = {}
+    utils.get_latest_package_versions(["missing"], errors)
+
+    assert str(errors["missing"]) == "Package missing not found"